@@ -0,0 +1,103 @@
+import asyncio
+import datetime
+import hmac
+import logging
+from typing import Optional
+import reflex as rx
+from reflex.config import get_config
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import FileResponse, JSONResponse, StreamingResponse
+from starlette.routing import Route
+from app.services.attendance import upsert_attendance
+from app.services.backups import resolve_backup
+from app.services.download_tokens import redeem_token
+from app.services.report_export import iter_report_csv
+from app.services.roster import RosterEntry, roster_cache
+
+KIOSK_TOKEN_HEADER = "X-Kiosk-Token"
+
+
+def parse_qr_payload(payload: str) -> Optional[int]:
+    """Return the athlete id from a GALIA:{id}:{full_name} ID-card payload."""
+    prefix, _, rest = payload.strip().partition(":")
+    athlete_id, _, _ = rest.partition(":")
+    if prefix != "GALIA" or not athlete_id.isdigit():
+        return None
+    return int(athlete_id)
+
+
+def _check_in(entry: RosterEntry, day: datetime.date, class_time: str):
+    with rx.session() as session:
+        upsert_attendance(session, [entry.athlete_id], day, "Present", class_time)
+        session.commit()
+
+
+async def checkin(request: Request) -> JSONResponse:
+    expected_token = getattr(get_config(), "kiosk_token", None)
+    if not expected_token:
+        return JSONResponse({"error": "Kiosk check-in is disabled."}, status_code=403)
+    if not hmac.compare_digest(
+        request.headers.get(KIOSK_TOKEN_HEADER, ""), expected_token
+    ):
+        return JSONResponse({"error": "Invalid kiosk token."}, status_code=401)
+    try:
+        body = await request.json()
+    except ValueError:
+        body = None
+    if not isinstance(body, dict):
+        return JSONResponse({"error": "Expected a JSON object."}, status_code=400)
+    athlete_id = parse_qr_payload(str(body.get("payload", "")))
+    if athlete_id is None:
+        return JSONResponse({"error": "Unrecognised QR code."}, status_code=400)
+    entry = await asyncio.to_thread(roster_cache.get, athlete_id)
+    if entry is None:
+        return JSONResponse({"error": "Unknown or inactive athlete."}, status_code=404)
+    now = datetime.datetime.now()
+    class_time = now.strftime("%H:%M")
+    try:
+        await asyncio.to_thread(_check_in, entry, now.date(), class_time)
+    except Exception as e:
+        logging.exception(f"Kiosk check-in error: {e}")
+        return JSONResponse({"error": "Check-in failed."}, status_code=500)
+    return JSONResponse(
+        {
+            "athlete_id": entry.athlete_id,
+            "full_name": entry.full_name,
+            "status": "Present",
+            "time": class_time,
+        }
+    )
+
+
+async def export_report(request: Request):
+    params = redeem_token(request.query_params.get("token", ""), "report")
+    if params is None:
+        return JSONResponse({"error": "Invalid or expired link."}, status_code=403)
+    start = datetime.datetime.fromisoformat(params["start"])
+    end = datetime.datetime.fromisoformat(params["end"])
+    return StreamingResponse(
+        iter_report_csv(params["report_type"], start, end),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{params["filename"]}"'},
+    )
+
+
+async def download_backup(request: Request):
+    params = redeem_token(request.query_params.get("token", ""), "backup")
+    if params is None:
+        return JSONResponse({"error": "Invalid or expired link."}, status_code=403)
+    try:
+        path = resolve_backup(params["name"])
+    except FileNotFoundError:
+        return JSONResponse({"error": "Backup not found."}, status_code=404)
+    return FileResponse(path, filename=path.name, media_type="application/zip")
+
+
+api = Starlette(
+    routes=[
+        Route("/api/checkin", checkin, methods=["POST"]),
+        Route("/api/reports/export", export_report),
+        Route("/api/backups/download", download_backup),
+    ]
+)
\ No newline at end of file
@@ -19,6 +19,12 @@ from app.components.competition_views import competitions_page
 from app.components.reporting_views import reporting_page
 from app.components.settings_views import settings_page
 from app.states.settings_state import SettingsState
+from app.services.db import configure_sqlite
+from app.i18n import loader_script, t, write_bundles
+from app.api import api
+from app.services.schema import migrate_database
+from app.services.backups import run_backup_schedule
+from app.services.workers import worker_pool_lifespan
 
 
 def dashboard_stat_card(
@@ -75,45 +81,33 @@ def index() -> rx.Component:
             rx.el.div(
                 rx.el.div(
                     rx.el.h1(
-                        LanguageState.translations[LanguageState.current_lang][
-                            "dashboard"
-                        ],
+                        t("dashboard"),
                         class_name="text-3xl font-bold text-gray-900 dark:text-white font-['Lora']",
                     ),
                     rx.el.p(
-                        LanguageState.translations[LanguageState.current_lang][
-                            "welcome_back"
-                        ],
+                        t("welcome_back"),
                         class_name="text-gray-500 dark:text-gray-400 mt-1",
                     ),
                     class_name="mb-8",
                 ),
                 rx.el.div(
                     dashboard_stat_card(
-                        LanguageState.translations[LanguageState.current_lang][
-                            "total_athletes"
-                        ],
+                        t("total_athletes"),
                         DashboardState.total_athletes,
                         "violet",
                     ),
                     dashboard_stat_card(
-                        LanguageState.translations[LanguageState.current_lang][
-                            "active_coaches"
-                        ],
+                        t("active_coaches"),
                         DashboardState.active_coaches,
                         "blue",
                     ),
                     dashboard_stat_card(
-                        LanguageState.translations[LanguageState.current_lang][
-                            "monthly_revenue"
-                        ],
+                        t("monthly_revenue"),
                         f"{DashboardState.monthly_revenue} DA",
                         "green",
                     ),
                     dashboard_stat_card(
-                        LanguageState.translations[LanguageState.current_lang][
-                            "unpaid_fees"
-                        ],
+                        t("unpaid_fees"),
                         DashboardState.unpaid_count,
                         "red",
                     ),
@@ -122,41 +116,31 @@ def index() -> rx.Component:
                 rx.el.div(
                     rx.el.div(
                         rx.el.h2(
-                            LanguageState.translations[LanguageState.current_lang][
-                                "quick_actions"
-                            ],
+                            t("quick_actions"),
                             class_name="text-xl font-bold text-gray-800 dark:text-white mb-4",
                         ),
                         rx.el.div(
                             quick_action_btn(
                                 "user-plus",
-                                LanguageState.translations[LanguageState.current_lang][
-                                    "add_athlete"
-                                ],
+                                t("add_athlete"),
                                 AthleteState.open_add_modal,
                                 "violet",
                             ),
                             quick_action_btn(
                                 "credit-card",
-                                LanguageState.translations[LanguageState.current_lang][
-                                    "record_payment"
-                                ],
+                                t("record_payment"),
                                 rx.redirect("/payments"),
                                 "green",
                             ),
                             quick_action_btn(
                                 "calendar-check",
-                                LanguageState.translations[LanguageState.current_lang][
-                                    "attendance"
-                                ],
+                                t("attendance"),
                                 rx.redirect("/attendance"),
                                 "blue",
                             ),
                             quick_action_btn(
                                 "medal",
-                                LanguageState.translations[LanguageState.current_lang][
-                                    "add_result"
-                                ],
+                                t("add_result"),
                                 rx.redirect("/competitions"),
                                 "orange",
                             ),
@@ -166,9 +150,7 @@ def index() -> rx.Component:
                     ),
                     rx.el.div(
                         rx.el.h2(
-                            LanguageState.translations[LanguageState.current_lang][
-                                "recent_activity"
-                            ],
+                            t("recent_activity"),
                             class_name="text-xl font-bold text-gray-800 dark:text-white mb-4",
                         ),
                         rx.el.div(
@@ -178,9 +160,7 @@ def index() -> rx.Component:
                                     DashboardState.recent_athletes, recent_activity_item
                                 ),
                                 rx.el.p(
-                                    LanguageState.translations[
-                                        LanguageState.current_lang
-                                    ]["no_activity"],
+                                    t("no_activity"),
                                     class_name="text-gray-500 dark:text-gray-400 p-4 text-center",
                                 ),
                             ),
@@ -208,11 +188,14 @@ def protected_page(page_content: rx.Component) -> rx.Component:
 
 
 from app.states.global_state import GlobalState
-from app.states.language_state import LanguageState
 
+configure_sqlite()
+write_bundles()
 app = rx.App(
+    api_transformer=api,
     theme=rx.theme(appearance="light"),
     head_components=[
+        loader_script(),
         rx.el.link(rel="preconnect", href="https://fonts.googleapis.com"),
         rx.el.link(rel="preconnect", href="https://fonts.gstatic.com", cross_origin=""),
         rx.el.link(
@@ -228,12 +211,10 @@ app = rx.App(
             """),
     ],
 )
-app.add_page(
-    index, route="/", on_load=[AuthState.initialize_database, DashboardState.load_stats]
-)
-app.add_page(
-    index, route="/", on_load=[AuthState.initialize_database, DashboardState.load_stats]
-)
+app.register_lifespan_task(migrate_database)
+app.register_lifespan_task(run_backup_schedule)
+app.register_lifespan_task(worker_pool_lifespan)
+app.add_page(index, route="/", on_load=DashboardState.load_stats)
 app.add_page(
     lambda: protected_page(athletes_page()),
     route="/athletes",
@@ -1,5 +1,6 @@
 import reflex as rx
 from app.states.athlete_state import AthleteState
+from app.components.pagination import pagination_controls
 from app.states.belt_progression_state import BeltProgressionState
 from app.states.settings_state import SettingsState
 from app.components.belt_progression_views import belt_progression_modal
@@ -256,6 +257,9 @@ def athletes_page() -> rx.Component:
             rx.foreach(AthleteState.athletes, athlete_card),
             class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",
         ),
+        pagination_controls(
+            AthleteState, f"{AthleteState.athlete_count_label} athletes"
+        ),
         athlete_form(),
         belt_progression_modal(),
         upload_modal(),
@@ -288,6 +292,18 @@ def upload_modal() -> rx.Component:
                     accept={"text/csv": [".csv"]},
                     multiple=False,
                 ),
+                rx.cond(
+                    AthleteState.is_importing | (AthleteState.import_parsed > 0),
+                    rx.el.div(
+                        rx.cond(
+                            AthleteState.is_importing,
+                            rx.icon("loader", class_name="w-4 h-4 mr-2 animate-spin"),
+                            rx.icon("list-checks", class_name="w-4 h-4 mr-2"),
+                        ),
+                        f"{AthleteState.import_parsed} rows parsed · {AthleteState.import_inserted} inserted · {AthleteState.import_merged} merged · {AthleteState.import_skipped} skipped · {AthleteState.import_rejected} rejected",
+                        class_name="mt-4 p-3 bg-gray-50 dark:bg-gray-800 text-gray-600 dark:text-gray-300 rounded-lg text-sm flex items-center",
+                    ),
+                ),
                 rx.cond(
                     AthleteState.upload_error,
                     rx.el.div(
@@ -317,7 +333,8 @@ def upload_modal() -> rx.Component:
                     on_click=lambda: AthleteState.handle_upload(
                         rx.upload_files("upload_csv")
                     ),
-                    class_name="px-4 py-2 bg-violet-600 text-white rounded-lg hover:bg-violet-700",
+                    disabled=AthleteState.is_importing,
+                    class_name="px-4 py-2 bg-violet-600 text-white rounded-lg hover:bg-violet-700 disabled:opacity-50",
                 ),
                 class_name="flex justify-end gap-2 mt-6",
             ),
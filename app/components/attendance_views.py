@@ -21,6 +21,12 @@ def status_button(
 def attendance_row(item: AttendanceItem) -> rx.Component:
     return rx.el.div(
         rx.el.div(
+            rx.el.input(
+                type="checkbox",
+                checked=AttendanceState.selected_ids.contains(item.athlete_id),
+                on_change=lambda _: AttendanceState.toggle_selected(item.athlete_id),
+                class_name="w-4 h-4 accent-blue-600",
+            ),
             rx.el.div(
                 rx.icon("user", class_name="w-5 h-5 text-gray-400"),
                 class_name="w-10 h-10 rounded-full bg-gray-100 dark:bg-gray-800 flex items-center justify-center",
@@ -59,6 +65,44 @@ def stat_pill(label: str, value: int, color: str) -> rx.Component:
     )
 
 
+def bulk_button(label: str, event: rx.event.EventType) -> rx.Component:
+    return rx.el.button(
+        label,
+        on_click=event,
+        class_name="px-3 py-2 rounded-lg border border-gray-200 dark:border-gray-700 text-sm font-medium hover:bg-gray-50 dark:hover:bg-gray-800 transition-colors",
+    )
+
+
+def bulk_actions() -> rx.Component:
+    return rx.el.div(
+        rx.el.select(
+            rx.el.option("Present", value="Present"),
+            rx.el.option("Late", value="Late"),
+            rx.el.option("Absent", value="Absent"),
+            value=AttendanceState.bulk_status,
+            on_change=AttendanceState.set_bulk_status,
+            class_name="px-3 py-2 rounded-lg border border-gray-200 dark:border-gray-700 dark:bg-gray-900 text-sm",
+        ),
+        bulk_button("Mark all", AttendanceState.mark_all(AttendanceState.bulk_status)),
+        bulk_button(
+            "Mark filtered",
+            AttendanceState.mark_filtered(AttendanceState.bulk_status),
+        ),
+        rx.cond(
+            AttendanceState.selected_ids.length() > 0,
+            rx.el.div(
+                bulk_button(
+                    f"Mark selected ({AttendanceState.selected_ids.length()})",
+                    AttendanceState.mark_selected(AttendanceState.bulk_status),
+                ),
+                bulk_button("Clear selection", AttendanceState.clear_selection),
+                class_name="flex gap-2",
+            ),
+        ),
+        class_name="flex flex-wrap items-center gap-2 mb-4",
+    )
+
+
 def attendance_page() -> rx.Component:
     return rx.el.div(
         rx.el.div(
@@ -105,6 +149,7 @@ def attendance_page() -> rx.Component:
             ),
             class_name="flex gap-4 mb-6",
         ),
+        bulk_actions(),
         rx.el.div(
             rx.foreach(AttendanceState.filtered_attendance, attendance_row),
             class_name="space-y-3",
@@ -1,6 +1,7 @@
 import reflex as rx
 from app.states.auth_state import AuthState
 from app.states.language_state import LanguageState
+from app.i18n import t
 from app.states.global_state import GlobalState
 
 
@@ -30,65 +31,47 @@ def dashboard_layout(content: rx.Component) -> rx.Component:
                 rx.el.nav(
                     sidebar_item(
                         "layout-dashboard",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "dashboard"
-                        ],
+                        t("dashboard"),
                         "/",
                     ),
                     sidebar_item(
                         "users",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "athletes"
-                        ],
+                        t("athletes"),
                         "/athletes",
                     ),
                     sidebar_item(
                         "user-cog",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "coaches"
-                        ],
+                        t("coaches"),
                         "/coaches",
                     ),
                     sidebar_item(
                         "users-round",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "age_categories"
-                        ],
+                        t("age_categories"),
                         "/age-categories",
                     ),
                     sidebar_item(
                         "credit-card",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "payments"
-                        ],
+                        t("payments"),
                         "/payments",
                     ),
                     sidebar_item(
                         "calendar-check",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "attendance"
-                        ],
+                        t("attendance"),
                         "/attendance",
                     ),
                     sidebar_item(
                         "trophy",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "competitions"
-                        ],
+                        t("competitions"),
                         "/competitions",
                     ),
                     sidebar_item(
                         "bar-chart-3",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "reports"
-                        ],
+                        t("reports"),
                         "/reports",
                     ),
                     sidebar_item(
                         "settings",
-                        LanguageState.translations[LanguageState.current_lang][
-                            "settings"
-                        ],
+                        t("settings"),
                         "/settings",
                     ),
                     class_name="flex flex-col gap-1 px-2",
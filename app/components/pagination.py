@@ -0,0 +1,29 @@
+import reflex as rx
+
+
+def pagination_controls(state: type[rx.State], summary: str) -> rx.Component:
+    """Previous/Next controls for a state paged with load_keyset_page."""
+    return rx.el.div(
+        rx.el.p(
+            f"{summary} · Page {state.page_number}",
+            class_name="text-sm text-gray-500 dark:text-gray-400",
+        ),
+        rx.el.div(
+            rx.el.button(
+                rx.icon("chevron-left", class_name="w-4 h-4"),
+                "Previous",
+                on_click=state.prev_page,
+                disabled=~state.has_prev_page,
+                class_name="flex items-center gap-1 px-4 py-2 rounded-xl border border-gray-200 dark:border-gray-800 hover:bg-gray-50 dark:hover:bg-gray-800 disabled:opacity-50 disabled:cursor-not-allowed transition-colors",
+            ),
+            rx.el.button(
+                "Next",
+                rx.icon("chevron-right", class_name="w-4 h-4"),
+                on_click=state.next_page,
+                disabled=~state.has_next_page,
+                class_name="flex items-center gap-1 px-4 py-2 rounded-xl border border-gray-200 dark:border-gray-800 hover:bg-gray-50 dark:hover:bg-gray-800 disabled:opacity-50 disabled:cursor-not-allowed transition-colors",
+            ),
+            class_name="flex gap-2",
+        ),
+        class_name="flex items-center justify-between mt-8",
+    )
@@ -1,5 +1,6 @@
 import reflex as rx
 from app.states.payment_state import PaymentState, PaymentData
+from app.components.pagination import pagination_controls
 import datetime
 
 
@@ -250,11 +251,20 @@ def payments_page() -> rx.Component:
                 "Financial Management",
                 class_name="text-3xl font-bold text-gray-900 dark:text-white font-['Lora']",
             ),
-            rx.el.button(
-                rx.icon("plus", class_name="w-5 h-5"),
-                "New Payment",
-                on_click=PaymentState.open_add_modal,
-                class_name="flex items-center gap-2 px-4 py-2 bg-violet-600 text-white rounded-xl hover:bg-violet-700 transition-colors shadow-sm font-medium",
+            rx.el.div(
+                rx.el.button(
+                    rx.icon("printer", class_name="w-5 h-5"),
+                    "Print Receipts",
+                    on_click=PaymentState.download_page_receipts,
+                    class_name="flex items-center gap-2 px-4 py-2 bg-gray-100 dark:bg-gray-800 hover:bg-gray-200 dark:hover:bg-gray-700 rounded-xl transition-colors font-medium",
+                ),
+                rx.el.button(
+                    rx.icon("plus", class_name="w-5 h-5"),
+                    "New Payment",
+                    on_click=PaymentState.open_add_modal,
+                    class_name="flex items-center gap-2 px-4 py-2 bg-violet-600 text-white rounded-xl hover:bg-violet-700 transition-colors shadow-sm font-medium",
+                ),
+                class_name="flex gap-2",
             ),
             class_name="flex items-center justify-between mb-8",
         ),
@@ -317,9 +327,9 @@ def payments_page() -> rx.Component:
             class_name="flex flex-col md:flex-row gap-4 mb-8",
         ),
         rx.cond(
-            PaymentState.filtered_payments,
+            PaymentState.payments,
             rx.el.div(
-                rx.foreach(PaymentState.filtered_payments, payment_card),
+                rx.foreach(PaymentState.payments, payment_card),
                 class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",
             ),
             rx.el.div(
@@ -340,5 +350,6 @@ def payments_page() -> rx.Component:
                 class_name="bg-white dark:bg-gray-900 rounded-2xl border border-gray-200 dark:border-gray-800 p-8",
             ),
         ),
+        pagination_controls(PaymentState, f"{PaymentState.payment_count} payments"),
         payment_form(),
     )
\ No newline at end of file
@@ -68,7 +68,16 @@ def settings_page() -> rx.Component:
                         rx.icon("printer", class_name="w-5 h-5"),
                         "Generate All ID Cards",
                         on_click=SettingsState.generate_all_id_cards,
-                        class_name="flex items-center gap-2 px-6 py-3 bg-blue-600 text-white rounded-xl hover:bg-blue-700 transition-colors font-medium shadow-lg shadow-blue-200",
+                        disabled=SettingsState.is_generating_cards,
+                        class_name="flex items-center gap-2 px-6 py-3 bg-blue-600 text-white rounded-xl hover:bg-blue-700 transition-colors font-medium shadow-lg shadow-blue-200 disabled:opacity-50",
+                    ),
+                    rx.cond(
+                        SettingsState.is_generating_cards,
+                        rx.el.progress(
+                            value=SettingsState.id_card_progress,
+                            max=SettingsState.id_card_total,
+                            class_name="w-full max-w-md h-2",
+                        ),
                     ),
                     rx.cond(
                         SettingsState.id_card_status,
@@ -93,11 +102,16 @@ def settings_page() -> rx.Component:
                             "Create a full backup of the database. This will download a ZIP file containing all your data.",
                             class_name="text-sm text-gray-500 dark:text-gray-400 mb-4",
                         ),
+                        rx.el.p(
+                            f"Last backup: {SettingsState.last_backup_date}",
+                            class_name="text-xs text-gray-500 dark:text-gray-400 mb-4",
+                        ),
                         rx.el.button(
                             rx.icon("download", class_name="w-4 h-4"),
                             "Download Backup",
                             on_click=SettingsState.backup_database,
-                            class_name="flex items-center gap-2 px-4 py-2 border border-gray-200 dark:border-gray-700 rounded-lg hover:bg-gray-50 dark:hover:bg-gray-800 transition-colors",
+                            disabled=SettingsState.is_backing_up,
+                            class_name="flex items-center gap-2 px-4 py-2 border border-gray-200 dark:border-gray-700 rounded-lg hover:bg-gray-50 dark:hover:bg-gray-800 transition-colors disabled:opacity-50",
                         ),
                         rx.cond(
                             SettingsState.backup_status,
@@ -133,7 +147,8 @@ def settings_page() -> rx.Component:
                             on_click=lambda: SettingsState.handle_restore_upload(
                                 rx.upload_files("restore_upload")
                             ),
-                            class_name="w-full px-4 py-2 bg-red-600 text-white rounded-lg hover:bg-red-700 text-sm font-medium",
+                            disabled=SettingsState.is_restoring,
+                            class_name="w-full px-4 py-2 bg-red-600 text-white rounded-lg hover:bg-red-700 text-sm font-medium disabled:opacity-50",
                         ),
                         rx.cond(
                             SettingsState.restore_status,
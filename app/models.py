@@ -1,7 +1,7 @@
 import reflex as rx
 from typing import Optional
-from datetime import datetime
-from sqlmodel import SQLModel, Field
+from datetime import date as date_type, datetime
+from sqlmodel import SQLModel, Field, Index
 
 
 class User(SQLModel, table=True):
@@ -29,6 +29,10 @@ class AgeCategory(SQLModel, table=True):
 
 
 class Athlete(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_athlete_is_active_full_name", "is_active", "full_name"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     full_name: str
     date_of_birth: str
@@ -41,6 +45,7 @@ class Athlete(SQLModel, table=True):
     is_active: bool = True
     current_belt_rank_id: Optional[int] = None
     age_category_id: Optional[int] = None
+    fingerprint: Optional[str] = Field(default=None, index=True)
 
 
 class Coach(SQLModel, table=True):
@@ -54,11 +59,15 @@ class Coach(SQLModel, table=True):
 
 
 class Payment(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_payment_year_covered_month_covered", "year_covered", "month_covered"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    athlete_id: int
+    athlete_id: int = Field(index=True)
     amount: float
     payment_type: str
-    payment_date: datetime = Field(default_factory=datetime.now)
+    payment_date: datetime = Field(default_factory=datetime.now, index=True)
     month_covered: Optional[int] = None
     year_covered: Optional[int] = None
     status: str
@@ -66,13 +75,28 @@ class Payment(SQLModel, table=True):
 
 
 class Attendance(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_attendance_athlete_id_day", "athlete_id", "day", unique=True),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     athlete_id: int
-    date: datetime = Field(default_factory=datetime.now)
+    date: datetime = Field(default_factory=datetime.now, index=True)
+    day: Optional[date_type] = None
     status: str
     class_time: Optional[str] = None
 
 
+class DailyAttendanceSummary(SQLModel, table=True):
+    __tablename__ = "daily_attendance_summary"
+
+    day: date_type = Field(primary_key=True)
+    present: int = 0
+    late: int = 0
+    absent: int = 0
+    total: int = 0
+
+
 class Competition(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
@@ -82,6 +106,15 @@ class Competition(SQLModel, table=True):
 
 
 class CompetitionResult(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_competitionresult_competition_id_athlete_id_category",
+            "competition_id",
+            "athlete_id",
+            "category",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     competition_id: int
     athlete_id: int
@@ -90,6 +123,12 @@ class CompetitionResult(SQLModel, table=True):
 
 
 class BeltPromotion(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_beltpromotion_athlete_id_promotion_date", "athlete_id", "promotion_date"
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     athlete_id: int
     from_belt_id: Optional[int] = None
@@ -102,6 +141,6 @@ class BeltPromotion(SQLModel, table=True):
 
 class Setting(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    key: str
+    key: str = Field(index=True)
     value: str
     description: Optional[str] = None
\ No newline at end of file
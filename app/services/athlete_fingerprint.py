@@ -0,0 +1,53 @@
+import datetime
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+
+PHONE_DIGITS = 9
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y")
+
+
+def normalize_name(full_name: str) -> str:
+    """Lowercase, strip accents and punctuation, and sort the name's words."""
+    decomposed = unicodedata.normalize("NFKD", full_name or "")
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    words = re.findall(r"\w+", stripped.casefold())
+    return " ".join(sorted(words))
+
+
+def parse_date_of_birth(value: str) -> Optional[str]:
+    """Return an ISO date for a supported format, "" for blank, or None if invalid."""
+    if not value:
+        return ""
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def normalize_date_of_birth(date_of_birth: Optional[str]) -> str:
+    """ISO-format a birth date so 15/03/2010 and 2010-03-15 compare equal."""
+    value = (date_of_birth or "").strip()
+    parsed = parse_date_of_birth(value)
+    return value if parsed is None else parsed
+
+
+def normalize_phone(phone: Optional[str]) -> str:
+    """Keep the trailing national digits so +213 and 0 prefixes compare equal."""
+    return re.sub(r"\D", "", phone or "")[-PHONE_DIGITS:]
+
+
+def athlete_fingerprint(
+    full_name: str, date_of_birth: Optional[str], phone: Optional[str]
+) -> str:
+    key = "|".join(
+        [
+            normalize_name(full_name),
+            normalize_date_of_birth(date_of_birth),
+            normalize_phone(phone),
+        ]
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
\ No newline at end of file
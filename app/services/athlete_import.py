@@ -0,0 +1,105 @@
+import datetime
+from typing import Iterator, NamedTuple, Optional
+import reflex as rx
+import sqlmodel
+from app.models import Athlete
+from app.services.athlete_fingerprint import athlete_fingerprint, parse_date_of_birth
+
+IMPORT_BATCH_SIZE = 1000
+GENDERS = {"male": "Male", "m": "Male", "female": "Female", "f": "Female"}
+
+
+class BatchResult(NamedTuple):
+    parsed: int
+    inserted: int
+    merged: int
+    skipped: int
+    rejected: int
+
+
+def athlete_values(row: dict) -> Optional[dict]:
+    """Validate a CSV row into column values, or return None to reject it."""
+    values = {key: (value or "").strip() for key, value in row.items() if key}
+    full_name = values.get("full_name", "")
+    date_of_birth = parse_date_of_birth(values.get("date_of_birth", ""))
+    gender = GENDERS.get(values.get("gender", "").lower() or "male")
+    if not full_name or date_of_birth is None or gender is None:
+        return None
+    return {
+        "full_name": full_name,
+        "date_of_birth": date_of_birth,
+        "gender": gender,
+        "phone": values.get("phone", ""),
+        "guardian_name": values.get("guardian_name", ""),
+        "guardian_phone": values.get("guardian_phone", ""),
+        "is_active": True,
+        "fingerprint": athlete_fingerprint(
+            full_name, date_of_birth, values.get("phone", "")
+        ),
+    }
+
+
+def _merge_into(athlete: Athlete, values: dict) -> bool:
+    """Fill blanks on an existing athlete from an imported row; True if it changed."""
+    changed = not athlete.is_active
+    athlete.is_active = True
+    for key in ("phone", "guardian_name", "guardian_phone"):
+        if values[key] and not getattr(athlete, key):
+            setattr(athlete, key, values[key])
+            changed = True
+    return changed
+
+
+def import_next_batch(
+    rows: Iterator[dict], batch_size: int = IMPORT_BATCH_SIZE
+) -> BatchResult:
+    """Read up to batch_size rows, merge known athletes and insert the new ones.
+
+    Rows are matched on their fingerprint through one indexed IN lookup per
+    batch, so duplicates cost O(1) per row instead of a table scan.
+    """
+    parsed = 0
+    rejected = 0
+    skipped = 0
+    batch = {}
+    for row in rows:
+        parsed += 1
+        values = athlete_values(row)
+        if values is None:
+            rejected += 1
+        elif values["fingerprint"] in batch:
+            skipped += 1
+        else:
+            batch[values["fingerprint"]] = values
+        if parsed >= batch_size:
+            break
+    merged = 0
+    new_rows = []
+    if batch:
+        with rx.session() as session:
+            existing = {
+                athlete.fingerprint: athlete
+                for athlete in session.exec(
+                    sqlmodel.select(Athlete).where(Athlete.fingerprint.in_(batch))
+                )
+            }
+            joined_date = datetime.datetime.now()
+            for fingerprint, values in batch.items():
+                athlete = existing.get(fingerprint)
+                if athlete is None:
+                    new_rows.append({**values, "joined_date": joined_date})
+                elif _merge_into(athlete, values):
+                    session.add(athlete)
+                    merged += 1
+                else:
+                    skipped += 1
+            if new_rows:
+                session.exec(sqlmodel.insert(Athlete.__table__), params=new_rows)
+            session.commit()
+    return BatchResult(
+        parsed=parsed,
+        inserted=len(new_rows),
+        merged=merged,
+        skipped=skipped,
+        rejected=rejected,
+    )
\ No newline at end of file
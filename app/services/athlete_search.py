@@ -0,0 +1,87 @@
+from typing import Optional
+import sqlmodel
+from app.models import Athlete
+
+MIN_TRIGRAM_LENGTH = 3
+BROAD_SEARCH_MATCHES = 500
+SEARCH_COLUMNS = ["full_name", "phone", "guardian_name"]
+
+
+def _match(term: str, column: Optional[str] = None):
+    phrase = '"' + term.replace('"', '""') + '"'
+    if column:
+        phrase = f"{column} : {phrase}"
+    return sqlmodel.text("athlete_fts MATCH :phrase").bindparams(phrase=phrase)
+
+
+def is_broad_search(session, query: str) -> bool:
+    """Whether a search hits at least BROAD_SEARCH_MATCHES athletes.
+
+    Reads the trigram index alone and stops at the threshold, so it stays
+    cheap even when most of the roster matches.
+    """
+    term = query.strip()
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        return False
+    hits = (
+        sqlmodel.select(sqlmodel.literal_column("rowid"))
+        .select_from(sqlmodel.table("athlete_fts"))
+        .where(_match(term))
+        .limit(BROAD_SEARCH_MATCHES)
+    )
+    return _count(session, hits) >= BROAD_SEARCH_MATCHES
+
+
+def count_broad_search(session, query: str, filters: list, limit: int) -> int:
+    """Count athletes matching a broad search and filters, stopping at limit.
+
+    Hits are read in index order and each athlete is looked up by id, so the
+    count stops early instead of collecting every hit before joining.
+    """
+    matches = (
+        sqlmodel.select(Athlete.id)
+        .select_from(sqlmodel.table("athlete_fts"))
+        # The unary plus keeps SQLite from probing the index once per athlete.
+        .join(Athlete, Athlete.id == sqlmodel.literal_column("+athlete_fts.rowid"))
+        .where(_match(query.strip()), *filters)
+        .limit(limit)
+    )
+    return _count(session, matches)
+
+
+def _count(session, statement) -> int:
+    return session.exec(
+        sqlmodel.select(sqlmodel.func.count()).select_from(statement.subquery())
+    ).one()
+
+
+def athlete_search_filter(
+    query: str, column: Optional[str] = None, broad: bool = False
+):
+    """Match athletes by name, phone or guardian name through the trigram index.
+
+    Pass column to match one indexed column only, e.g. "full_name". Terms
+    shorter than a trigram fall back to a name prefix match. A broad search
+    matches with LIKE instead: the index would hand back most of the roster,
+    while a name-ordered scan finds the first page within a few rows.
+    """
+    term = query.strip()
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        # LIKE folds ASCII case only, so every match sorts at or after the
+        # upper-cased prefix; the bound lets SQLite seek instead of scanning.
+        lowest = "".join(c.upper() if c.isascii() else c for c in term)
+        return sqlmodel.and_(
+            Athlete.full_name >= lowest,
+            Athlete.full_name.startswith(term, autoescape=True),
+        )
+    if broad:
+        names = [column] if column else SEARCH_COLUMNS
+        return sqlmodel.or_(
+            *(getattr(Athlete, name).contains(term, autoescape=True) for name in names)
+        )
+    matches = (
+        sqlmodel.select(sqlmodel.literal_column("rowid"))
+        .select_from(sqlmodel.table("athlete_fts"))
+        .where(_match(term, column))
+    )
+    return Athlete.id.in_(matches)
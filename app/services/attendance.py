@@ -0,0 +1,63 @@
+import datetime
+from typing import Optional
+import sqlmodel
+from sqlalchemy.dialects.sqlite import insert
+from app.models import Attendance
+
+UPSERT_CHUNK_SIZE = 500
+
+
+def upsert_attendance(
+    session,
+    athlete_ids: list[int],
+    day: datetime.date,
+    status: str,
+    class_time: Optional[str] = None,
+):
+    """Set one status for many athletes on a day, one statement per chunk.
+
+    Clearing ("None") only touches existing records, as marking never creates
+    empty ones.
+    """
+    if status == "None":
+        session.exec(
+            sqlmodel.update(Attendance)
+            .where(Attendance.athlete_id.in_(athlete_ids))
+            .where(Attendance.day == day)
+            .values(status=status)
+        )
+        return
+    recorded_at = datetime.datetime.combine(day, datetime.time())
+    for start in range(0, len(athlete_ids), UPSERT_CHUNK_SIZE):
+        statement = insert(Attendance).values(
+            [
+                {
+                    "athlete_id": athlete_id,
+                    "date": recorded_at,
+                    "day": day,
+                    "status": status,
+                    "class_time": class_time,
+                }
+                for athlete_id in athlete_ids[start : start + UPSERT_CHUNK_SIZE]
+            ]
+        )
+        session.exec(
+            statement.on_conflict_do_update(
+                index_elements=[Attendance.athlete_id, Attendance.day],
+                set_={
+                    "status": statement.excluded.status,
+                    "class_time": statement.excluded.class_time,
+                },
+            )
+        )
+
+
+def attendance_records(
+    session, athlete_ids: list[int], day: datetime.date
+) -> dict[int, Attendance]:
+    records = session.exec(
+        sqlmodel.select(Attendance)
+        .where(Attendance.athlete_id.in_(athlete_ids))
+        .where(Attendance.day == day)
+    ).all()
+    return {record.athlete_id: record for record in records}
\ No newline at end of file
@@ -0,0 +1,108 @@
+import argparse
+import datetime
+from typing import Optional
+import reflex as rx
+from app.services.db import configure_sqlite
+
+ATTENDANCE_SUMMARY_DDL = """
+CREATE TABLE IF NOT EXISTS daily_attendance_summary (
+    day DATE NOT NULL,
+    present INTEGER NOT NULL,
+    late INTEGER NOT NULL,
+    absent INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (day)
+)
+"""
+_SUMMARY_KEY = "COALESCE({row}.day, date({row}.date))"
+_ADD_ROW = """
+        INSERT INTO daily_attendance_summary (day, present, late, absent, total)
+        VALUES (
+            {key},
+            {row}.status = 'Present', {row}.status = 'Late', {row}.status = 'Absent', 1
+        )
+        ON CONFLICT (day) DO UPDATE SET
+            present = present + excluded.present,
+            late = late + excluded.late,
+            absent = absent + excluded.absent,
+            total = total + 1;
+"""
+_REMOVE_ROW = """
+        UPDATE daily_attendance_summary SET
+            present = present - ({row}.status = 'Present'),
+            late = late - ({row}.status = 'Late'),
+            absent = absent - ({row}.status = 'Absent'),
+            total = total - 1
+        WHERE day = {key};
+        DELETE FROM daily_attendance_summary WHERE day = {key} AND total <= 0;
+"""
+
+
+def _add_row(row: str) -> str:
+    return _ADD_ROW.format(row=row, key=_SUMMARY_KEY.format(row=row))
+
+
+def _remove_row(row: str) -> str:
+    return _REMOVE_ROW.format(row=row, key=_SUMMARY_KEY.format(row=row))
+
+
+ATTENDANCE_SUMMARY_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS attendance_summary_ai
+    AFTER INSERT ON attendance BEGIN {_add_row("new")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS attendance_summary_ad
+    AFTER DELETE ON attendance BEGIN {_remove_row("old")} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS attendance_summary_au
+    AFTER UPDATE OF date, day, status ON attendance
+    BEGIN {_remove_row("old")} {_add_row("new")} END
+    """,
+]
+
+
+def rebuild_attendance_summary(
+    connection, since: Optional[datetime.date] = None
+) -> int:
+    """Recompute the daily rollup from raw attendance rows, optionally from a day on."""
+    where = "WHERE COALESCE(day, date(date)) >= ?" if since else ""
+    params = (since.isoformat(),) if since else ()
+    connection.exec_driver_sql(
+        f"DELETE FROM daily_attendance_summary {'WHERE day >= ?' if since else ''}",
+        params,
+    )
+    result = connection.exec_driver_sql(
+        f"""
+        INSERT INTO daily_attendance_summary (day, present, late, absent, total)
+        SELECT
+            COALESCE(day, date(date)),
+            SUM(status = 'Present'), SUM(status = 'Late'), SUM(status = 'Absent'),
+            COUNT(*)
+        FROM attendance {where}
+        GROUP BY 1
+        """,
+        params,
+    )
+    return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily attendance summary from raw attendance rows."
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.date.fromisoformat,
+        help="Only rebuild days on or after this date (YYYY-MM-DD).",
+    )
+    args = parser.parse_args()
+    configure_sqlite()
+    with rx.model.get_engine().begin() as connection:
+        count = rebuild_attendance_summary(connection, args.since)
+    print(f"Rebuilt {count} daily attendance summary rows.")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,405 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterator, Optional
+import reflex as rx
+import sqlmodel
+from reflex.config import get_config
+from app.services.schema import latest_schema_version, run_migrations
+from app.services.settings import settings_cache
+
+BACKUP_DIR = Path("backups")
+BACKUP_ARCNAME = "reflex.db"
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_STEP_SLEEP_SECONDS = 0.005
+BACKUP_HISTORY_KEY = "backup.history"
+INCREMENTAL_PAGES_ARCNAME = "pages.bin"
+INCREMENTAL_META_ARCNAME = "meta.json"
+DEFAULT_BACKUP_RETENTION = {"hourly": 24, "daily": 7, "weekly": 4}
+DEFAULT_FULL_BACKUP_INTERVAL_HOURS = 24
+DEFAULT_BACKUP_INTERVAL_MINUTES = 60
+_PAGE_NUMBER = struct.Struct(">I")
+_DIGEST_SIZE = 8
+_backup_lock = threading.Lock()
+
+
+def database_path() -> Path:
+    return Path(rx.model.get_engine().url.database).resolve()
+
+
+def backup_dir() -> Path:
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    return BACKUP_DIR.resolve()
+
+
+def _pause_between_steps(status: int, remaining: int, total: int):
+    time.sleep(BACKUP_STEP_SLEEP_SECONDS)
+
+
+def snapshot_database(destination: Path):
+    """Copy a consistent snapshot of the live database with the SQLite backup API.
+
+    The copy runs in page steps. The progress callback sleeps after each one,
+    so the source lock is released between steps and this thread gives up
+    the GIL.
+    """
+    source = sqlite3.connect(database_path())
+    target = sqlite3.connect(destination)
+    try:
+        source.backup(
+            target, pages=BACKUP_PAGES_PER_STEP, progress=_pause_between_steps
+        )
+    finally:
+        target.close()
+        source.close()
+
+
+def compress_snapshot(snapshot: Path, archive: Path):
+    """Deflate a snapshot into a zip archive, streaming it from disk."""
+    partial_path = archive.with_name(f"{archive.name}.part")
+    with zipfile.ZipFile(partial_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.write(snapshot, arcname=BACKUP_ARCNAME)
+    os.replace(partial_path, archive)
+
+
+def _page_size(path: Path) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def _iter_pages(path: Path, page_size: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while page := f.read(page_size):
+            yield page
+
+
+def _page_digest(page: bytes) -> bytes:
+    return hashlib.blake2b(page, digest_size=_DIGEST_SIZE).digest()
+
+
+def _manifest_path(archive: Path) -> Path:
+    return archive.with_name(f"{archive.name}.manifest")
+
+
+def _write_manifest(archive: Path, page_size: int, digests: bytes):
+    """Store the page size and per-page digests of the state an archive restores to."""
+    with open(_manifest_path(archive), "wb") as f:
+        f.write(_PAGE_NUMBER.pack(page_size))
+        f.write(digests)
+
+
+def _read_manifest(archive: Path) -> Optional[tuple[int, bytes]]:
+    try:
+        data = _manifest_path(archive).read_bytes()
+    except FileNotFoundError:
+        return None
+    (page_size,) = _PAGE_NUMBER.unpack_from(data)
+    return page_size, data[_PAGE_NUMBER.size :]
+
+
+def _write_full(snapshot: Path, archive: Path):
+    page_size = _page_size(snapshot)
+    digests = b"".join(_page_digest(page) for page in _iter_pages(snapshot, page_size))
+    compress_snapshot(snapshot, archive)
+    _write_manifest(archive, page_size, digests)
+
+
+def _write_incremental(snapshot: Path, archive: Path, parent: Path) -> bool:
+    """Store only the pages that differ from the parent backup; False if not possible."""
+    manifest = _read_manifest(parent)
+    page_size = _page_size(snapshot)
+    if manifest is None or manifest[0] != page_size:
+        return False
+    parent_digests = manifest[1]
+    digests = bytearray()
+    changed = 0
+    partial_path = archive.with_name(f"{archive.name}.part")
+    with zipfile.ZipFile(partial_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open(INCREMENTAL_PAGES_ARCNAME, "w") as pages:
+            for number, page in enumerate(_iter_pages(snapshot, page_size)):
+                digest = _page_digest(page)
+                offset = number * _DIGEST_SIZE
+                if parent_digests[offset : offset + _DIGEST_SIZE] != digest:
+                    pages.write(_PAGE_NUMBER.pack(number))
+                    pages.write(page)
+                    changed += 1
+                digests += digest
+        zf.writestr(
+            INCREMENTAL_META_ARCNAME,
+            json.dumps(
+                {
+                    "parent": parent.name,
+                    "page_size": page_size,
+                    "page_count": len(digests) // _DIGEST_SIZE,
+                    "changed_pages": changed,
+                }
+            ),
+        )
+    os.replace(partial_path, archive)
+    _write_manifest(archive, page_size, bytes(digests))
+    return True
+
+
+def load_backup_history() -> list[dict]:
+    return json.loads(settings_cache.get(BACKUP_HISTORY_KEY, "[]"))
+
+
+def save_backup_history(history: list[dict]):
+    settings_cache.set(BACKUP_HISTORY_KEY, json.dumps(history), "Backup history")
+
+
+def last_backup_date() -> Optional[str]:
+    history = load_backup_history()
+    return history[-1]["created_at"] if history else None
+
+
+def _full_backup_due(history: list[dict], now: datetime.datetime) -> bool:
+    fulls = [entry for entry in history if entry["kind"] == "full"]
+    if not fulls:
+        return True
+    hours = getattr(get_config(), "full_backup_interval_hours", None)
+    interval = datetime.timedelta(hours=hours or DEFAULT_FULL_BACKUP_INTERVAL_HOURS)
+    return now - datetime.datetime.fromisoformat(fulls[-1]["created_at"]) >= interval
+
+
+def create_backup(incremental: bool = False) -> Path:
+    """Back up the database and record it in the history.
+
+    Incremental backups store only pages changed since the previous backup and
+    fall back to a full backup when there is no usable parent.
+    """
+    with _backup_lock:
+        now = datetime.datetime.now()
+        history = load_backup_history()
+        parent = None
+        if incremental and history and not _full_backup_due(history, now):
+            parent = backup_dir() / history[-1]["name"]
+        stem = f"backup_{now.strftime('%Y%m%d_%H%M%S')}"
+        with tempfile.TemporaryDirectory(dir=backup_dir()) as workdir:
+            snapshot = Path(workdir) / BACKUP_ARCNAME
+            snapshot_database(snapshot)
+            archive = backup_dir() / f"{stem}.incr.zip"
+            if parent is None or not _write_incremental(snapshot, archive, parent):
+                archive = backup_dir() / f"{stem}.zip"
+                parent = None
+                _write_full(snapshot, archive)
+        history.append(
+            {
+                "name": archive.name,
+                "kind": "incremental" if parent else "full",
+                "parent": parent.name if parent else None,
+                "created_at": now.isoformat(timespec="seconds"),
+                "size": archive.stat().st_size,
+            }
+        )
+        save_backup_history(apply_retention(history))
+        return archive
+
+
+async def run_backup_schedule():
+    """Take an incremental backup every interval; registered as a lifespan task."""
+    minutes = getattr(get_config(), "backup_interval_minutes", None)
+    if minutes is None:
+        minutes = DEFAULT_BACKUP_INTERVAL_MINUTES
+    if minutes <= 0:
+        return
+    while True:
+        await asyncio.sleep(minutes * 60)
+        try:
+            archive = await asyncio.to_thread(create_backup, True)
+            logging.info(f"Scheduled backup written to {archive.name}.")
+        except Exception as e:
+            logging.exception(f"Scheduled backup failed: {e}")
+
+
+def _retention_keep(history: list[dict]) -> set[str]:
+    """Names to keep: the newest backup per hour, day and ISO week, plus ancestors."""
+    retention = dict(DEFAULT_BACKUP_RETENTION)
+    retention.update(getattr(get_config(), "backup_retention", None) or {})
+    bucket_keys = {
+        "hourly": lambda at: at.strftime("%Y%m%d%H"),
+        "daily": lambda at: at.strftime("%Y%m%d"),
+        "weekly": lambda at: "%d-%02d" % at.isocalendar()[:2],
+    }
+    keep = {history[-1]["name"]} if history else set()
+    for tier, bucket_key in bucket_keys.items():
+        buckets: dict[str, str] = {}
+        for entry in history:
+            created_at = datetime.datetime.fromisoformat(entry["created_at"])
+            buckets[bucket_key(created_at)] = entry["name"]
+        newest = sorted(buckets, reverse=True)[: retention.get(tier, 0)]
+        keep.update(buckets[key] for key in newest)
+    parents = {entry["name"]: entry["parent"] for entry in history}
+    for name in list(keep):
+        while parents.get(name):
+            name = parents[name]
+            keep.add(name)
+    return keep
+
+
+def apply_retention(history: list[dict]) -> list[dict]:
+    """Delete backups that fall outside the retention policy; return the rest."""
+    keep = _retention_keep(history)
+    for entry in history:
+        if entry["name"] not in keep:
+            archive = backup_dir() / entry["name"]
+            archive.unlink(missing_ok=True)
+            _manifest_path(archive).unlink(missing_ok=True)
+            logging.info(f"Removed expired backup {entry['name']}.")
+    return [entry for entry in history if entry["name"] in keep]
+
+
+def materialize_backup(archive: Path, destination: Path):
+    """Rebuild a full database file from a full or incremental backup archive."""
+    chain = []
+    while True:
+        with zipfile.ZipFile(archive) as zf:
+            if INCREMENTAL_META_ARCNAME not in zf.namelist():
+                break
+            meta = json.loads(zf.read(INCREMENTAL_META_ARCNAME))
+        chain.append((archive, meta))
+        archive = resolve_backup(meta["parent"])
+    with zipfile.ZipFile(archive) as zf:
+        with zf.open(BACKUP_ARCNAME) as source, open(destination, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+    record_size = _PAGE_NUMBER.size
+    with open(destination, "r+b") as target:
+        for incremental, meta in reversed(chain):
+            page_size = meta["page_size"]
+            with zipfile.ZipFile(incremental) as zf:
+                with zf.open(INCREMENTAL_PAGES_ARCNAME) as pages:
+                    while header := pages.read(record_size):
+                        (number,) = _PAGE_NUMBER.unpack(header)
+                        target.seek(number * page_size)
+                        target.write(pages.read(page_size))
+            target.truncate(meta["page_count"] * page_size)
+
+
+def _extract_database(archive: Path, destination: Path):
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+    except zipfile.BadZipFile:
+        raise ValueError("Invalid file format. Please upload a valid ZIP backup.")
+    if INCREMENTAL_META_ARCNAME in names:
+        materialize_backup(archive, destination)
+    elif BACKUP_ARCNAME in names:
+        with zipfile.ZipFile(archive) as zf:
+            with zf.open(BACKUP_ARCNAME) as source, open(destination, "wb") as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+    else:
+        raise ValueError("Invalid backup: reflex.db not found in archive.")
+
+
+def _validate_database(path: Path):
+    """Reject corrupt databases and ones written by a newer schema than this app knows."""
+    connection = sqlite3.connect(path)
+    try:
+        try:
+            (result,) = connection.execute("PRAGMA integrity_check").fetchone()
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"Invalid backup: {e}")
+        if result != "ok":
+            raise ValueError(f"Invalid backup: integrity check failed ({result}).")
+        try:
+            (version,) = connection.execute(
+                "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            version = 0
+        if version > latest_schema_version():
+            raise ValueError(
+                f"Backup schema version {version} is newer than this app supports."
+            )
+    finally:
+        connection.close()
+
+
+def _migrate_staged_database(path: Path):
+    """Bring a staged database up to the current schema before it goes live."""
+    engine = sqlmodel.create_engine(f"sqlite:///{path}")
+    try:
+        run_migrations(engine)
+    finally:
+        engine.dispose()
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        connection.close()
+
+
+def _carry_backup_history(path: Path):
+    """Copy the live backup history into a staged database.
+
+    The restored file holds the history as it was when the backup was taken,
+    which does not list that backup or any later one; keeping it would orphan
+    every archive on disk.
+    """
+    history = json.dumps(load_backup_history())
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.execute(
+                "INSERT INTO setting (key, value, description) VALUES (?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (BACKUP_HISTORY_KEY, history, "Backup history"),
+            )
+    finally:
+        connection.close()
+
+
+def restore_backup(archive: Path):
+    """Validate and migrate a backup archive, then swap it in for the live database.
+
+    The archive is extracted to a file next to the database, checked and
+    migrated with its own engine, given the live backup history, and only then
+    atomically replaces the live file. A failure at any step leaves the live database untouched. The
+    connection pool is recreated afterwards, so no restart is needed.
+    """
+    live_path = database_path()
+    fd, staged = tempfile.mkstemp(dir=live_path.parent, suffix=".restore")
+    os.close(fd)
+    staged_path = Path(staged)
+    try:
+        _extract_database(archive, staged_path)
+        _validate_database(staged_path)
+        _migrate_staged_database(staged_path)
+        with _backup_lock:
+            _carry_backup_history(staged_path)
+            engine = rx.model.get_engine()
+            engine.dispose()
+            connection = sqlite3.connect(live_path)
+            try:
+                connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                connection.close()
+            os.replace(staged_path, live_path)
+            for suffix in ("-wal", "-shm"):
+                Path(f"{live_path}{suffix}").unlink(missing_ok=True)
+            engine.dispose()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{staged_path}{suffix}").unlink(missing_ok=True)
+
+
+def resolve_backup(name: str) -> Path:
+    """Return a backup file by name, refusing anything outside the backup directory."""
+    path = (backup_dir() / name).resolve()
+    if path.parent != backup_dir() or not path.is_file():
+        raise FileNotFoundError(name)
+    return path
\ No newline at end of file
@@ -0,0 +1,45 @@
+from typing import NamedTuple
+from app.models import Athlete, Coach, Payment
+import sqlmodel
+from sqlmodel import func
+
+
+class DashboardMetrics(NamedTuple):
+    total_athletes: int
+    active_coaches: int
+    monthly_revenue: float
+    unpaid_count: int
+
+
+def load_dashboard_metrics(session, month: int, year: int) -> DashboardMetrics:
+    """Compute the dashboard counters with one aggregate query."""
+    month_payments = (Payment.month_covered == month) & (Payment.year_covered == year)
+    total_athletes = (
+        sqlmodel.select(func.count(Athlete.id))
+        .where(Athlete.is_active == True)
+        .scalar_subquery()
+    )
+    active_coaches = (
+        sqlmodel.select(func.count(Coach.id))
+        .where(Coach.is_active == True)
+        .scalar_subquery()
+    )
+    monthly_revenue = (
+        sqlmodel.select(func.coalesce(func.sum(Payment.amount), 0.0))
+        .where(month_payments)
+        .scalar_subquery()
+    )
+    paid_athletes = (
+        sqlmodel.select(func.count(Payment.athlete_id.distinct()))
+        .where(month_payments)
+        .scalar_subquery()
+    )
+    athletes, coaches, revenue, paid = session.exec(
+        sqlmodel.select(total_athletes, active_coaches, monthly_revenue, paid_athletes)
+    ).one()
+    return DashboardMetrics(
+        total_athletes=athletes,
+        active_coaches=coaches,
+        monthly_revenue=float(revenue),
+        unpaid_count=max(0, athletes - paid),
+    )
\ No newline at end of file
@@ -0,0 +1,50 @@
+import logging
+import re
+import sqlite3
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from reflex.config import get_config
+
+DEFAULT_SQLITE_PRAGMAS = {
+    "busy_timeout": 5000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+}
+SQLITE_SETTING_PREFIX = "sqlite."
+
+
+def sqlite_pragmas(dbapi_connection: sqlite3.Connection) -> dict[str, str]:
+    """Resolve PRAGMA values: defaults, then rxconfig.py, then Setting rows."""
+    pragmas = dict(DEFAULT_SQLITE_PRAGMAS)
+    pragmas.update(getattr(get_config(), "sqlite_pragmas", None) or {})
+    try:
+        rows = dbapi_connection.execute(
+            "SELECT key, value FROM setting WHERE key LIKE ?",
+            (f"{SQLITE_SETTING_PREFIX}%",),
+        ).fetchall()
+    except sqlite3.DatabaseError:
+        rows = []
+    for key, value in rows:
+        name = key[len(SQLITE_SETTING_PREFIX) :]
+        if name in DEFAULT_SQLITE_PRAGMAS:
+            pragmas[name] = value
+    return {name: str(value) for name, value in pragmas.items()}
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    for name, value in sqlite_pragmas(dbapi_connection).items():
+        if not re.fullmatch(r"-?\w+", value):
+            logging.warning(f"Ignoring invalid SQLite PRAGMA {name}={value!r}")
+            continue
+        dbapi_connection.execute(f"PRAGMA {name} = {value}")
+
+
+def configure_sqlite():
+    """Apply the configured PRAGMAs to every new SQLite connection."""
+    if not event.contains(Engine, "connect", _apply_sqlite_pragmas):
+        event.listen(Engine, "connect", _apply_sqlite_pragmas)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import secrets
+import threading
+import time
+from typing import Optional
+from reflex.config import get_config
+
+DOWNLOAD_TOKEN_TTL_SECONDS = 300
+_tokens: dict[str, tuple[str, float, dict]] = {}
+_lock = threading.Lock()
+
+
+def issue_token(purpose: str, **params) -> str:
+    """Issue a short-lived token that lets a plain HTTP request fetch a download."""
+    token = secrets.token_urlsafe(24)
+    now = time.monotonic()
+    with _lock:
+        for key, (_, expires_at, _) in list(_tokens.items()):
+            if expires_at < now:
+                del _tokens[key]
+        _tokens[token] = (purpose, now + DOWNLOAD_TOKEN_TTL_SECONDS, params)
+    return token
+
+
+def redeem_token(token: str, purpose: str) -> Optional[dict]:
+    """Consume a valid, unexpired token for this purpose and return its parameters.
+
+    Tokens are single-use, so a leaked download URL cannot be replayed.
+    """
+    with _lock:
+        entry = _tokens.get(token)
+        if entry is None or entry[0] != purpose:
+            return None
+        del _tokens[token]
+    _, expires_at, params = entry
+    if expires_at < time.monotonic():
+        return None
+    return params
+
+
+def backend_url(path: str) -> str:
+    return f"{get_config().api_url.rstrip('/')}{path}"
\ No newline at end of file
@@ -0,0 +1,25 @@
+import logging
+from pathlib import Path
+
+
+def touch(path: Path):
+    """Mark a cached file as recently used."""
+    path.touch(exist_ok=True)
+
+
+def evict_lru(directory: Path, max_bytes: int, pattern: str = "*"):
+    """Delete the least recently used files until the directory fits in max_bytes."""
+    entries = []
+    for path in directory.glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        logging.info(f"Evicted cached file {path.name}.")
\ No newline at end of file
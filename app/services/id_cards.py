@@ -0,0 +1,105 @@
+import datetime
+import os
+from pathlib import Path
+from typing import NamedTuple
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+
+CARD_W = 85.6 * mm
+CARD_H = 53.98 * mm
+MARGIN_X = 15 * mm
+MARGIN_Y = 15 * mm
+SPACING_X = 5 * mm
+SPACING_Y = 5 * mm
+COLS_PER_PAGE = 2
+ROWS_PER_PAGE = 4
+CARDS_PER_PAGE = COLS_PER_PAGE * ROWS_PER_PAGE
+
+
+class IdCard(NamedTuple):
+    athlete_id: int
+    full_name: str
+    belt_name: str
+
+
+def draw_id_card(
+    c, card: IdCard, qr_image: ImageReader, valid_date: str, x: float, y: float
+):
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(0.5)
+    c.setFillColor(colors.white)
+    c.roundRect(x, y, CARD_W, CARD_H, 3 * mm, fill=1, stroke=1)
+    c.setFillColor(colors.HexColor("#DC2626"))
+    c.rect(x, y + CARD_H - 12 * mm, CARD_W, 12 * mm, fill=1, stroke=0)
+    c.setFillColor(colors.white)
+    c.setFont("Helvetica-Bold", 14)
+    c.drawCentredString(x + CARD_W / 2, y + CARD_H - 8 * mm, "GALIA CLUB KARATE")
+    c.setFillColor(colors.lightgrey)
+    c.rect(x + 4 * mm, y + 15 * mm, 25 * mm, 30 * mm, fill=1, stroke=1)
+    c.setFillColor(colors.gray)
+    c.setFont("Helvetica", 8)
+    c.drawCentredString(x + 16.5 * mm, y + 30 * mm, "PHOTO")
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(x + 33 * mm, y + 40 * mm, card.full_name)
+    c.setFont("Helvetica", 10)
+    c.drawString(x + 33 * mm, y + 34 * mm, f"Rank: {card.belt_name}")
+    c.drawString(x + 33 * mm, y + 29 * mm, f"ID: {card.athlete_id:05d}")
+    c.setFont("Helvetica", 8)
+    c.setFillColor(colors.gray)
+    c.drawString(x + 33 * mm, y + 24 * mm, f"Valid until: {valid_date}")
+    c.drawImage(
+        qr_image,
+        x + CARD_W - 22 * mm,
+        y + 4 * mm,
+        width=18 * mm,
+        height=18 * mm,
+    )
+    c.setFillColor(colors.HexColor("#1F2937"))
+    c.rect(x, y, CARD_W, 3 * mm, fill=1, stroke=0)
+
+
+def _valid_until() -> str:
+    return (datetime.datetime.now() + datetime.timedelta(days=365)).strftime("%Y-%m-%d")
+
+
+def render_id_card_sheet(path: str, cards: list[IdCard], qr_images: list[Path]):
+    """Lay cards out 2x4 per A4 page and write the PDF atomically.
+
+    Runs in a pool worker; the partial file carries the worker's pid so two
+    batches for the same day never write to the same file.
+    """
+    valid_date = _valid_until()
+    page_w, page_h = A4
+    partial_path = f"{path}.{os.getpid()}.part"
+    readers: dict[Path, ImageReader] = {}
+    c = canvas.Canvas(partial_path, pagesize=A4)
+    for index, (card, qr_path) in enumerate(zip(cards, qr_images)):
+        slot = index % CARDS_PER_PAGE
+        if index and slot == 0:
+            c.showPage()
+        row, col = divmod(slot, COLS_PER_PAGE)
+        x = MARGIN_X + col * (CARD_W + SPACING_X)
+        y = page_h - MARGIN_Y - CARD_H - row * (CARD_H + SPACING_Y)
+        if qr_path not in readers:
+            readers[qr_path] = ImageReader(str(qr_path))
+        draw_id_card(c, card, readers[qr_path], valid_date, x, y)
+    c.save()
+    os.replace(partial_path, path)
+
+
+def render_single_id_card(path: str, card: IdCard, qr_image: Path):
+    page_w, page_h = A4
+    c = canvas.Canvas(path, pagesize=A4)
+    draw_id_card(
+        c,
+        card,
+        ImageReader(str(qr_image)),
+        _valid_until(),
+        (page_w - CARD_W) / 2,
+        (page_h - CARD_H) / 2,
+    )
+    c.save()
\ No newline at end of file
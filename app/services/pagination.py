@@ -0,0 +1,73 @@
+from typing import Any, Callable, Optional
+import sqlmodel
+
+
+def fetch_keyset_page(
+    session,
+    query,
+    sort_columns: list,
+    page_size: int,
+    cursor: Optional[tuple] = None,
+    backwards: bool = False,
+    inclusive: bool = False,
+    descending: bool = False,
+) -> tuple[list, bool]:
+    """Fetch the page after (or before) a cursor on a unique sort key.
+
+    Returns the rows in display order and whether more rows exist in the
+    direction that was read.
+    """
+    ascending = descending == backwards
+    if cursor:
+        sort_key = sqlmodel.tuple_(*sort_columns)
+        bound = sqlmodel.tuple_(*cursor)
+        if ascending:
+            query = query.where(sort_key >= bound if inclusive else sort_key > bound)
+        else:
+            query = query.where(sort_key <= bound if inclusive else sort_key < bound)
+    query = query.order_by(
+        *(column if ascending else column.desc() for column in sort_columns)
+    )
+    rows = list(session.exec(query.limit(page_size + 1)).all())
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+    return rows, has_more
+
+
+def load_keyset_page(
+    state,
+    fetch: Callable[[Optional[tuple], bool, bool], tuple[list, bool]],
+    page_key: Callable[[Any], tuple],
+    cursor: Optional[tuple] = None,
+    backwards: bool = False,
+    inclusive: bool = False,
+) -> list:
+    """Fetch a page relative to a cursor and update the state's paging fields.
+
+    fetch(cursor, backwards, inclusive) returns rows in display order and
+    whether more exist in the direction read, like fetch_keyset_page. state
+    must have page_number, has_next_page, has_prev_page, _page_start and
+    _page_end; the last two hold page_key of the first and last row. A step
+    back past the first page reloads page one, and a step forward onto an
+    empty page steps back to the last one.
+    """
+    rows, has_more = fetch(cursor, backwards, inclusive)
+    if backwards:
+        if not has_more:
+            return load_keyset_page(state, fetch, page_key)
+        state.page_number = max(1, state.page_number - 1)
+        state.has_next_page = True
+    else:
+        if cursor and not rows:
+            return load_keyset_page(state, fetch, page_key, cursor, backwards=True)
+        if not cursor:
+            state.page_number = 1
+        elif not inclusive:
+            state.page_number += 1
+        state.has_next_page = has_more
+    state.has_prev_page = state.page_number > 1
+    state._page_start = page_key(rows[0]) if rows else None
+    state._page_end = page_key(rows[-1]) if rows else None
+    return rows
@@ -0,0 +1,33 @@
+import functools
+import bcrypt
+from reflex.config import get_config
+
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+def bcrypt_rounds() -> int:
+    return int(getattr(get_config(), "bcrypt_rounds", None) or DEFAULT_BCRYPT_ROUNDS)
+
+
+def hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=bcrypt_rounds())
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    except ValueError:
+        return False
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """True when the hash was made with a different cost than the configured one."""
+    parts = password_hash.split("$")
+    return len(parts) < 4 or parts[2] != f"{bcrypt_rounds():02d}"
+
+
+@functools.cache
+def dummy_hash() -> str:
+    """A fixed hash to check unknown usernames against, so they take as long."""
+    return hash_password("not-a-real-password")
\ No newline at end of file
@@ -0,0 +1,34 @@
+from typing import NamedTuple
+from app.models import Payment
+import sqlmodel
+from sqlmodel import case, func
+
+COLLECTED_STATUSES = ["Paid", "Partial"]
+OUTSTANDING_STATUSES = ["Unpaid", "Overdue"]
+
+
+class PaymentTotals(NamedTuple):
+    total_income: float
+    monthly_revenue: float
+    unpaid_count: int
+
+
+def load_payment_totals(session, month: int, year: int) -> PaymentTotals:
+    """Compute the payment page totals with conditional aggregates in SQL."""
+    collected = Payment.status.in_(COLLECTED_STATUSES)
+    this_month = (Payment.month_covered == month) & (Payment.year_covered == year)
+    total_income, monthly_revenue, unpaid_count = session.exec(
+        sqlmodel.select(
+            func.coalesce(func.sum(case((collected, Payment.amount), else_=0.0)), 0.0),
+            func.coalesce(
+                func.sum(case((collected & this_month, Payment.amount), else_=0.0)),
+                0.0,
+            ),
+            func.count(case((Payment.status.in_(OUTSTANDING_STATUSES), Payment.id))),
+        )
+    ).one()
+    return PaymentTotals(
+        total_income=float(total_income),
+        monthly_revenue=float(monthly_revenue),
+        unpaid_count=unpaid_count,
+    )
\ No newline at end of file
@@ -0,0 +1,83 @@
+import asyncio
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+import qrcode
+import reflex as rx
+from app.services.file_cache import evict_lru, touch
+from app.services.workers import run_in_pool
+
+QR_DIR_NAME = "qr"
+QR_CACHE_MAX_BYTES = 50 * 1024 * 1024
+QR_CHUNK_SIZE = 64
+
+
+def qr_payload(athlete_id: int, full_name: str) -> str:
+    return f"GALIA:{athlete_id}:{full_name}"
+
+
+def qr_cache_dir() -> Path:
+    return rx.get_upload_dir() / QR_DIR_NAME
+
+
+def qr_cache_path(payload: str) -> Path:
+    key = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+    return qr_cache_dir() / f"{key}.png"
+
+
+def write_qr_png(payload: str, path: str):
+    qr = qrcode.QRCode(box_size=10, border=1)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    qr_img = qr.make_image(fill_color="black", back_color="white")
+    img_buffer = io.BytesIO()
+    qr_img.save(img_buffer)
+    partial_path = f"{path}.{os.getpid()}.part"
+    with open(partial_path, "wb") as f:
+        f.write(img_buffer.getvalue())
+    os.replace(partial_path, path)
+
+
+def write_qr_pngs(jobs: list[tuple[str, str]]) -> int:
+    """Encode a chunk of (payload, path) jobs; runs inside a pool worker."""
+    for payload, path in jobs:
+        write_qr_png(payload, path)
+    return len(jobs)
+
+
+async def ensure_qr_codes(
+    payloads: list[str],
+    on_progress: Optional[Callable[[int], Awaitable[None]]] = None,
+) -> list[Path]:
+    """Return cached QR images for the payloads, encoding only the missing ones."""
+    qr_cache_dir().mkdir(parents=True, exist_ok=True)
+    paths = [qr_cache_path(payload) for payload in payloads]
+    missing = []
+    for payload, path in zip(payloads, paths):
+        if path.exists():
+            touch(path)
+        else:
+            missing.append((payload, str(path)))
+    done = len(payloads) - len(missing)
+    if on_progress is not None and done:
+        await on_progress(done)
+    chunks = [
+        run_in_pool(write_qr_pngs, missing[start : start + QR_CHUNK_SIZE])
+        for start in range(0, len(missing), QR_CHUNK_SIZE)
+    ]
+    for next_chunk in asyncio.as_completed(chunks):
+        done += await next_chunk
+        if on_progress is not None:
+            await on_progress(done)
+    return paths
+
+
+def invalidate_qr(athlete_id: int, full_name: str):
+    """Drop the cached QR image for an athlete's previous name."""
+    qr_cache_path(qr_payload(athlete_id, full_name)).unlink(missing_ok=True)
+
+
+def trim_qr_cache():
+    evict_lru(qr_cache_dir(), QR_CACHE_MAX_BYTES, "*.png")
\ No newline at end of file
@@ -0,0 +1,123 @@
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+import reflex as rx
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.units import cm
+from app.models import Athlete, Payment
+from app.services.file_cache import evict_lru, touch
+from app.services.workers import run_in_pool
+
+RECEIPT_DIR_NAME = "receipts"
+RECEIPT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+def receipt_fields(payment: Payment, athlete: Athlete) -> dict:
+    """Collect every value printed on a receipt, so it can be hashed and pickled."""
+    description = f"{payment.payment_type}"
+    if payment.month_covered:
+        month_name = datetime.date(2000, payment.month_covered, 1).strftime("%B")
+        description += f" - {month_name} {payment.year_covered}"
+    return {
+        "payment_id": payment.id,
+        "issued_on": datetime.date.today().isoformat(),
+        "athlete_name": athlete.full_name,
+        "description": description,
+        "amount": payment.amount,
+    }
+
+
+def receipt_key(fields: dict) -> str:
+    payload = json.dumps(fields, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def receipt_dir() -> Path:
+    directory = rx.get_upload_dir() / RECEIPT_DIR_NAME
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def draw_receipt(c, fields: dict):
+    width, height = A4
+    red_color = colors.HexColor("#DC2626")
+    dark_gray = colors.HexColor("#1F2937")
+    c.setFillColor(red_color)
+    c.rect(0, height - 3 * cm, width, 3 * cm, fill=1, stroke=0)
+    c.setFillColor(colors.white)
+    c.setFont("Helvetica-Bold", 24)
+    c.drawString(2 * cm, height - 1.8 * cm, "GALIA CLUB KARATE")
+    c.setFont("Helvetica", 12)
+    c.drawString(2 * cm, height - 2.5 * cm, "Official Payment Receipt")
+    c.setFillColor(dark_gray)
+    c.setFont("Helvetica", 10)
+    c.drawString(
+        width - 7 * cm, height - 4.5 * cm, f"Receipt #: {fields['payment_id']:06d}"
+    )
+    c.drawString(width - 7 * cm, height - 5 * cm, f"Date: {fields['issued_on']}")
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(2 * cm, height - 5 * cm, "Received From:")
+    c.setFont("Helvetica", 12)
+    c.drawString(2 * cm, height - 5.7 * cm, fields["athlete_name"])
+    table_y = height - 8 * cm
+    c.setStrokeColor(colors.lightgrey)
+    c.line(2 * cm, table_y, width - 2 * cm, table_y)
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(2.5 * cm, table_y - 0.8 * cm, "Description")
+    c.drawString(width - 5 * cm, table_y - 0.8 * cm, "Amount")
+    c.line(2 * cm, table_y - 1.2 * cm, width - 2 * cm, table_y - 1.2 * cm)
+    c.setFont("Helvetica", 10)
+    c.drawString(2.5 * cm, table_y - 2 * cm, fields["description"])
+    c.drawString(width - 5 * cm, table_y - 2 * cm, f"{fields['amount']:,.2f} DA")
+    c.line(2 * cm, table_y - 3 * cm, width - 2 * cm, table_y - 3 * cm)
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(width - 8 * cm, table_y - 4 * cm, "Total Paid:")
+    c.setFillColor(red_color)
+    c.drawString(width - 5 * cm, table_y - 4 * cm, f"{fields['amount']:,.2f} DA")
+    c.setFillColor(colors.gray)
+    c.setFont("Helvetica-Oblique", 8)
+    c.drawCentredString(
+        width / 2,
+        2 * cm,
+        "Thank you for your payment. Keep this receipt for your records.",
+    )
+    c.drawCentredString(
+        width / 2, 1.5 * cm, "Galia Club Manager - Generated System Receipt"
+    )
+
+
+def render_receipts(path: str, receipts: list[dict]):
+    """Draw one receipt per page and atomically move the PDF into place."""
+    partial_path = f"{path}.{os.getpid()}.part"
+    c = canvas.Canvas(partial_path, pagesize=A4)
+    for fields in receipts:
+        draw_receipt(c, fields)
+        c.showPage()
+    c.save()
+    os.replace(partial_path, path)
+
+
+async def ensure_receipts_pdf(receipts: list[dict]) -> str:
+    """Return the cached PDF for these receipts, rendering it in the pool if needed."""
+    keys = [receipt_key(fields) for fields in receipts]
+    if len(receipts) == 1:
+        filename = f"receipt_{receipts[0]['payment_id']}_{keys[0]}.pdf"
+    else:
+        batch_key = hashlib.sha256("".join(keys).encode("utf-8")).hexdigest()[:16]
+        filename = f"receipts_batch_{batch_key}.pdf"
+    directory = receipt_dir()
+    path = directory / filename
+    if path.exists():
+        touch(path)
+    else:
+        await run_in_pool(render_receipts, str(path), receipts)
+        if len(receipts) == 1:
+            for stale in directory.glob(f"receipt_{receipts[0]['payment_id']}_*.pdf"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        evict_lru(directory, RECEIPT_CACHE_MAX_BYTES, "*.pdf")
+    return f"/_upload/{RECEIPT_DIR_NAME}/{filename}"
\ No newline at end of file
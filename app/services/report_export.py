@@ -0,0 +1,72 @@
+import csv
+import datetime
+import io
+from typing import Iterator
+import reflex as rx
+import sqlmodel
+from app.models import Athlete, Attendance, CompetitionResult, Payment
+
+YIELD_PER = 1000
+REPORT_TYPES = ("Athletes", "Payments", "Attendance", "Competitions")
+
+
+def report_query(report_type: str, start: datetime.datetime, end: datetime.datetime):
+    """Return the CSV header and column query for a report type."""
+    if report_type == "Athletes":
+        return ["ID", "Full Name", "Gender", "Phone", "Belt Rank"], sqlmodel.select(
+            Athlete.id,
+            Athlete.full_name,
+            Athlete.gender,
+            Athlete.phone,
+            Athlete.current_belt_rank_id,
+        ).where(Athlete.is_active == True)
+    if report_type == "Payments":
+        return [
+            "ID",
+            "Athlete ID",
+            "Amount",
+            "Type",
+            "Date",
+            "Status",
+        ], sqlmodel.select(
+            Payment.id,
+            Payment.athlete_id,
+            Payment.amount,
+            Payment.payment_type,
+            Payment.payment_date,
+            Payment.status,
+        ).where((Payment.payment_date >= start) & (Payment.payment_date < end))
+    if report_type == "Attendance":
+        return ["Date", "Athlete ID", "Status", "Time"], sqlmodel.select(
+            Attendance.date,
+            Attendance.athlete_id,
+            Attendance.status,
+            Attendance.class_time,
+        ).where((Attendance.date >= start) & (Attendance.date < end))
+    if report_type == "Competitions":
+        return ["Competition", "Athlete ID", "Result", "Category"], sqlmodel.select(
+            CompetitionResult.competition_id,
+            CompetitionResult.athlete_id,
+            CompetitionResult.result,
+            CompetitionResult.category,
+        )
+    raise ValueError(f"Unknown report type: {report_type}")
+
+
+def iter_report_csv(
+    report_type: str, start: datetime.datetime, end: datetime.datetime
+) -> Iterator[str]:
+    """Yield the report as CSV text chunks of about YIELD_PER rows each."""
+    header, query = report_query(report_type, start, end)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    with rx.session() as session:
+        result = session.exec(query.execution_options(yield_per=YIELD_PER))
+        for rows in result.partitions():
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
\ No newline at end of file
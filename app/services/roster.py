@@ -0,0 +1,49 @@
+import threading
+import time
+from typing import NamedTuple, Optional
+import reflex as rx
+import sqlmodel
+from app.models import Athlete
+
+ROSTER_TTL_SECONDS = 60
+
+
+class RosterEntry(NamedTuple):
+    athlete_id: int
+    full_name: str
+
+
+class RosterCache:
+    """In-memory map of active athletes, reloaded on expiry or on an unknown id."""
+
+    def __init__(self, ttl: float = ROSTER_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries: dict[int, RosterEntry] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _reload(self):
+        with rx.session() as session:
+            rows = session.exec(
+                sqlmodel.select(Athlete.id, Athlete.full_name).where(
+                    Athlete.is_active == True
+                )
+            ).all()
+        self._entries = {
+            athlete_id: RosterEntry(athlete_id, full_name)
+            for athlete_id, full_name in rows
+        }
+        self._loaded_at = time.monotonic()
+
+    def get(self, athlete_id: int) -> Optional[RosterEntry]:
+        with self._lock:
+            expired = time.monotonic() - self._loaded_at > self.ttl
+            if expired or athlete_id not in self._entries:
+                self._reload()
+            return self._entries.get(athlete_id)
+
+    def invalidate(self):
+        self._loaded_at = 0.0
+
+
+roster_cache = RosterCache()
\ No newline at end of file
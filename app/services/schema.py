@@ -0,0 +1,412 @@
+import datetime
+import logging
+import reflex as rx
+import sqlmodel
+from app.services.athlete_fingerprint import athlete_fingerprint
+from app.services.attendance_summary import (
+    ATTENDANCE_SUMMARY_DDL,
+    ATTENDANCE_SUMMARY_TRIGGERS,
+    rebuild_attendance_summary,
+)
+from app.services.passwords import hash_password
+
+DEFAULT_BELTS = [
+    "White",
+    "Yellow",
+    "Orange",
+    "Green",
+    "Blue",
+    "Purple",
+    "Brown",
+    "Black",
+]
+DEFAULT_AGE_CATEGORIES = [
+    ("Mini", 5, 7, "Beginners 5-7 years"),
+    ("Poussins", 8, 9, "Kids 8-9 years"),
+    ("Benjamins", 10, 11, "Kids 10-11 years"),
+    ("Minimes", 12, 13, "Teens 12-13 years"),
+    ("Cadets", 14, 15, "Teens 14-15 years"),
+    ("Juniors", 16, 17, "Teens 16-17 years"),
+    ("Seniors", 18, 99, "Adults 18+ years"),
+]
+DEFAULT_SETTINGS = [
+    ("monthly_fee", "500", "Monthly subscription fee in DA"),
+    ("yearly_license", "300", "Annual license fee in DA"),
+]
+
+# Migration 1 is frozen: later schema changes belong in their own migrations,
+# never in this DDL, so it means the same thing on every database it runs on.
+BASE_SCHEMA_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS user (
+        id INTEGER NOT NULL,
+        username VARCHAR NOT NULL,
+        password_hash VARCHAR NOT NULL,
+        role VARCHAR NOT NULL,
+        created_at DATETIME NOT NULL,
+        is_active BOOLEAN NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS beltrank (
+        id INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        color VARCHAR NOT NULL,
+        rank_order INTEGER NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS agecategory (
+        id INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        min_age INTEGER NOT NULL,
+        max_age INTEGER NOT NULL,
+        description VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS athlete (
+        id INTEGER NOT NULL,
+        full_name VARCHAR NOT NULL,
+        date_of_birth VARCHAR NOT NULL,
+        gender VARCHAR NOT NULL,
+        address VARCHAR,
+        phone VARCHAR,
+        guardian_name VARCHAR,
+        guardian_phone VARCHAR,
+        joined_date DATETIME NOT NULL,
+        is_active BOOLEAN NOT NULL,
+        current_belt_rank_id INTEGER,
+        age_category_id INTEGER,
+        fingerprint VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS coach (
+        id INTEGER NOT NULL,
+        full_name VARCHAR NOT NULL,
+        specialization VARCHAR,
+        phone VARCHAR NOT NULL,
+        email VARCHAR,
+        joined_date DATETIME NOT NULL,
+        is_active BOOLEAN NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS payment (
+        id INTEGER NOT NULL,
+        athlete_id INTEGER NOT NULL,
+        amount FLOAT NOT NULL,
+        payment_type VARCHAR NOT NULL,
+        payment_date DATETIME NOT NULL,
+        month_covered INTEGER,
+        year_covered INTEGER,
+        status VARCHAR NOT NULL,
+        notes VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS attendance (
+        id INTEGER NOT NULL,
+        athlete_id INTEGER NOT NULL,
+        date DATETIME NOT NULL,
+        status VARCHAR NOT NULL,
+        class_time VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS competition (
+        id INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        date DATETIME NOT NULL,
+        location VARCHAR NOT NULL,
+        description VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS competitionresult (
+        id INTEGER NOT NULL,
+        competition_id INTEGER NOT NULL,
+        athlete_id INTEGER NOT NULL,
+        result VARCHAR NOT NULL,
+        category VARCHAR NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS beltpromotion (
+        id INTEGER NOT NULL,
+        athlete_id INTEGER NOT NULL,
+        from_belt_id INTEGER,
+        to_belt_id INTEGER NOT NULL,
+        promotion_date DATETIME NOT NULL,
+        examiner_name VARCHAR,
+        notes VARCHAR,
+        media_files VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS setting (
+        id INTEGER NOT NULL,
+        "key" VARCHAR NOT NULL,
+        value VARCHAR NOT NULL,
+        description VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+]
+BASE_SCHEMA_INDEXES = [
+    ("ix_athlete_fingerprint", "athlete", "fingerprint"),
+    ("ix_athlete_is_active_full_name", "athlete", "is_active, full_name"),
+    ("ix_payment_athlete_id", "payment", "athlete_id"),
+    ("ix_payment_payment_date", "payment", "payment_date"),
+    ("ix_payment_year_covered_month_covered", "payment", "year_covered, month_covered"),
+    ("ix_attendance_date", "attendance", "date"),
+    ("ix_attendance_athlete_id_date", "attendance", "athlete_id, date"),
+    (
+        "ix_competitionresult_competition_id_athlete_id_category",
+        "competitionresult",
+        "competition_id, athlete_id, category",
+    ),
+    (
+        "ix_beltpromotion_athlete_id_promotion_date",
+        "beltpromotion",
+        "athlete_id, promotion_date",
+    ),
+    ("ix_setting_key", "setting", '"key"'),
+]
+# Columns added after the baseline release, for databases created before migrations.
+BASE_SCHEMA_COLUMNS = [("athlete", "fingerprint", "VARCHAR")]
+
+ATHLETE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE athlete_fts USING fts5(
+        full_name, phone, guardian_name,
+        content='athlete', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS athlete_fts_ai AFTER INSERT ON athlete BEGIN
+        INSERT INTO athlete_fts(rowid, full_name, phone, guardian_name)
+        VALUES (new.id, new.full_name, new.phone, new.guardian_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS athlete_fts_ad AFTER DELETE ON athlete BEGIN
+        INSERT INTO athlete_fts(athlete_fts, rowid, full_name, phone, guardian_name)
+        VALUES ('delete', old.id, old.full_name, old.phone, old.guardian_name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS athlete_fts_au
+    AFTER UPDATE OF full_name, phone, guardian_name ON athlete BEGIN
+        INSERT INTO athlete_fts(athlete_fts, rowid, full_name, phone, guardian_name)
+        VALUES ('delete', old.id, old.full_name, old.phone, old.guardian_name);
+        INSERT INTO athlete_fts(rowid, full_name, phone, guardian_name)
+        VALUES (new.id, new.full_name, new.phone, new.guardian_name);
+    END
+    """,
+    "INSERT INTO athlete_fts(athlete_fts) VALUES ('rebuild')",
+]
+
+
+SCHEMA_VERSION_DDL = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def current_schema_version(connection) -> int:
+    connection.exec_driver_sql(SCHEMA_VERSION_DDL)
+    return connection.exec_driver_sql(
+        "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+    ).scalar_one()
+
+
+def latest_schema_version() -> int:
+    return MIGRATIONS[-1][0]
+
+
+def run_migrations(engine) -> int:
+    """Apply pending migrations in order, each in its own transaction."""
+    with engine.begin() as connection:
+        version = current_schema_version(connection)
+    for number, description, migrate in MIGRATIONS:
+        if number <= version:
+            continue
+        with engine.begin() as connection:
+            if current_schema_version(connection) >= number:
+                continue
+            migrate(connection)
+            connection.exec_driver_sql(
+                "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                (number, description),
+            )
+        logging.info(f"Applied migration {number}: {description}.")
+        version = number
+    return version
+
+
+def migrate_database():
+    """Bring the configured database up to date; registered as a lifespan task."""
+    try:
+        version = run_migrations(rx.model.get_engine())
+        logging.info(f"Database schema is at version {version}.")
+    except Exception as e:
+        logging.exception(f"Database migration failed: {e}")
+        raise
+
+
+def _create_tables(connection):
+    """Create the base tables and indexes, and add columns older databases lack."""
+    inspector = sqlmodel.inspect(connection)
+    for table, column, column_type in BASE_SCHEMA_COLUMNS:
+        if not inspector.has_table(table):
+            continue
+        existing = {info["name"] for info in inspector.get_columns(table)}
+        if column not in existing:
+            connection.exec_driver_sql(
+                f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"
+            )
+            logging.info(f"Added column {table}.{column}.")
+    for statement in BASE_SCHEMA_DDL:
+        connection.exec_driver_sql(statement)
+    for name, table, columns in BASE_SCHEMA_INDEXES:
+        connection.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+        )
+
+
+def _create_athlete_search(connection):
+    if not sqlmodel.inspect(connection).has_table("athlete_fts"):
+        for statement in ATHLETE_SEARCH_DDL:
+            connection.exec_driver_sql(statement)
+
+
+def _backfill_athlete_fingerprints(connection):
+    rows = connection.exec_driver_sql(
+        "SELECT id, full_name, date_of_birth, phone FROM athlete"
+        " WHERE fingerprint IS NULL"
+    ).fetchall()
+    if rows:
+        connection.exec_driver_sql(
+            "UPDATE athlete SET fingerprint = ? WHERE id = ?",
+            [
+                (athlete_fingerprint(full_name, date_of_birth, phone), athlete_id)
+                for athlete_id, full_name, date_of_birth, phone in rows
+            ],
+        )
+        logging.info(f"Fingerprinted {len(rows)} athletes.")
+
+
+def _seed_defaults(connection):
+    """Insert the admin user, belt ranks, age categories and fees if missing."""
+    now = datetime.datetime.now().isoformat(sep=" ")
+    connection.exec_driver_sql(
+        "INSERT INTO user (username, password_hash, role, created_at, is_active)"
+        " SELECT 'admin', ?, 'admin', ?, 1"
+        " WHERE NOT EXISTS (SELECT 1 FROM user WHERE username = 'admin')",
+        (hash_password("admin123"), now),
+    )
+    if connection.exec_driver_sql("SELECT 1 FROM beltrank LIMIT 1").first() is None:
+        connection.exec_driver_sql(
+            "INSERT INTO beltrank (name, color, rank_order) VALUES (?, ?, ?)",
+            [
+                (name, name.lower(), order)
+                for order, name in enumerate(DEFAULT_BELTS, start=1)
+            ],
+        )
+    if connection.exec_driver_sql("SELECT 1 FROM agecategory LIMIT 1").first() is None:
+        connection.exec_driver_sql(
+            "INSERT INTO agecategory (name, min_age, max_age, description)"
+            " VALUES (?, ?, ?, ?)",
+            DEFAULT_AGE_CATEGORIES,
+        )
+    connection.exec_driver_sql(
+        "INSERT INTO setting (key, value, description) SELECT ?, ?, ?"
+        " WHERE NOT EXISTS (SELECT 1 FROM setting WHERE key = ?)",
+        [
+            (key, value, description, key)
+            for key, value, description in DEFAULT_SETTINGS
+        ],
+    )
+
+
+def _unique_attendance_per_day(connection):
+    """Keep the latest record per athlete and date, then enforce it with a unique index."""
+    connection.exec_driver_sql(
+        "DELETE FROM attendance WHERE id NOT IN"
+        " (SELECT MAX(id) FROM attendance GROUP BY athlete_id, date)"
+    )
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_attendance_athlete_id_date")
+    connection.exec_driver_sql(
+        "CREATE UNIQUE INDEX ix_attendance_athlete_id_date"
+        " ON attendance (athlete_id, date)"
+    )
+
+
+def _attendance_day_column(connection):
+    """Key attendance on a calendar day instead of a datetime, one record per day."""
+    columns = {
+        column["name"]
+        for column in sqlmodel.inspect(connection).get_columns("attendance")
+    }
+    if "day" not in columns:
+        connection.exec_driver_sql("ALTER TABLE attendance ADD COLUMN day DATE")
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_attendance_athlete_id_day")
+    connection.exec_driver_sql(
+        "UPDATE attendance SET day = date(date) WHERE day IS NULL"
+    )
+    connection.exec_driver_sql(
+        "DELETE FROM attendance WHERE id NOT IN"
+        " (SELECT MAX(id) FROM attendance GROUP BY athlete_id, day)"
+    )
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_attendance_athlete_id_date")
+    connection.exec_driver_sql(
+        "CREATE UNIQUE INDEX ix_attendance_athlete_id_day"
+        " ON attendance (athlete_id, day)"
+    )
+
+
+def _attendance_summary(connection):
+    connection.exec_driver_sql(ATTENDANCE_SUMMARY_DDL)
+    for statement in ATTENDANCE_SUMMARY_TRIGGERS:
+        connection.exec_driver_sql(statement)
+    rebuild_attendance_summary(connection)
+
+
+def _unique_setting_key(connection):
+    """Keep the latest row per setting key, then enforce it with a unique index.
+
+    Only this migration makes ix_setting_key unique; the model keeps a plain
+    index so nothing earlier can build the constraint before duplicates go.
+    """
+    connection.exec_driver_sql(
+        "DELETE FROM setting WHERE id NOT IN (SELECT MAX(id) FROM setting GROUP BY key)"
+    )
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_setting_key")
+    connection.exec_driver_sql("CREATE UNIQUE INDEX ix_setting_key ON setting (key)")
+
+
+MIGRATIONS = [
+    (1, "create tables and indexes", _create_tables),
+    (2, "athlete full-text search", _create_athlete_search),
+    (3, "athlete fingerprints", _backfill_athlete_fingerprints),
+    (4, "default admin, belts, age categories and fees", _seed_defaults),
+    (5, "unique attendance per athlete and date", _unique_attendance_per_day),
+    (6, "attendance day column", _attendance_day_column),
+    (7, "daily attendance summary", _attendance_summary),
+    (8, "unique setting keys", _unique_setting_key),
+]
\ No newline at end of file
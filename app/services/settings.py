@@ -0,0 +1,88 @@
+import logging
+import threading
+from typing import Optional
+import reflex as rx
+import sqlmodel
+from sqlalchemy.dialects.sqlite import insert
+from app.models import Setting
+
+MONTHLY_FEE_KEY = "monthly_fee"
+YEARLY_LICENSE_KEY = "yearly_license"
+DEFAULT_MONTHLY_FEE = 500.0
+DEFAULT_YEARLY_LICENSE = 300.0
+
+
+class SettingsCache:
+    """Setting rows held in memory: loaded once, read through on a miss, updated on write."""
+
+    def __init__(self):
+        self._values: dict[str, Optional[str]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with rx.session() as session:
+            rows = session.exec(sqlmodel.select(Setting.key, Setting.value)).all()
+        self._values = dict(rows)
+        self._loaded = True
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if key not in self._values:
+                with rx.session() as session:
+                    self._values[key] = session.exec(
+                        sqlmodel.select(Setting.value).where(Setting.key == key)
+                    ).first()
+            value = self._values[key]
+        return default if value is None else value
+
+    def get_float(self, key: str, default: float) -> float:
+        value = self.get(key)
+        try:
+            return float(value) if value is not None else default
+        except ValueError:
+            logging.warning(f"Setting {key}={value!r} is not a number.")
+            return default
+
+    def set_many(
+        self, values: dict[str, str], descriptions: Optional[dict[str, str]] = None
+    ):
+        """Upsert several settings in one statement and update the cache."""
+        descriptions = descriptions or {}
+        statement = insert(Setting).values(
+            [
+                {"key": key, "value": value, "description": descriptions.get(key)}
+                for key, value in values.items()
+            ]
+        )
+        with self._lock:
+            with rx.session() as session:
+                session.exec(
+                    statement.on_conflict_do_update(
+                        index_elements=[Setting.key],
+                        set_={"value": statement.excluded.value},
+                    )
+                )
+                session.commit()
+            self._values.update(values)
+
+    def set(self, key: str, value: str, description: Optional[str] = None):
+        self.set_many({key: value}, {key: description} if description else None)
+
+    def invalidate(self):
+        with self._lock:
+            self._values = {}
+            self._loaded = False
+
+
+settings_cache = SettingsCache()
+
+
+def monthly_fee() -> float:
+    return settings_cache.get_float(MONTHLY_FEE_KEY, DEFAULT_MONTHLY_FEE)
+
+
+def yearly_license() -> float:
+    return settings_cache.get_float(YEARLY_LICENSE_KEY, DEFAULT_YEARLY_LICENSE)
\ No newline at end of file
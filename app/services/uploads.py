@@ -0,0 +1,19 @@
+import os
+import tempfile
+from pathlib import Path
+import reflex as rx
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def spool_upload(file: rx.UploadFile, suffix: str = "") -> Path:
+    """Copy an uploaded file to a temporary file chunk by chunk and return its path."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as spooled:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                spooled.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return Path(path)
\ No newline at end of file
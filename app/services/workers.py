@@ -0,0 +1,46 @@
+import asyncio
+import contextlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+# Forking the server would copy its event loop, threads and open database
+# connections into every worker; start workers from a clean process instead.
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            mp_context=multiprocessing.get_context(START_METHOD),
+        )
+    return _executor
+
+
+def shutdown_pool():
+    """Stop the worker processes, dropping queued work; the pool restarts on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+@contextlib.asynccontextmanager
+async def worker_pool_lifespan():
+    """Shut the worker pool down with the app; registered as a lifespan task."""
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(shutdown_pool)
+
+
+def run_in_pool(fn, *args) -> asyncio.Future:
+    """Run a CPU-bound, picklable function in the shared worker process pool."""
+    return asyncio.get_running_loop().run_in_executor(_get_executor(), fn, *args)
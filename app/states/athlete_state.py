@@ -3,12 +3,36 @@ from typing import Optional
 from app.models import Athlete, AgeCategory, BeltRank
 import sqlmodel
 import csv
-import io
+import os
 import logging
+import asyncio
+from app.services.athlete_search import (
+    athlete_search_filter,
+    count_broad_search,
+    is_broad_search,
+)
+from app.services.athlete_import import import_next_batch
+from app.services.athlete_fingerprint import athlete_fingerprint
+from app.services.uploads import spool_upload
+from app.services.pagination import fetch_keyset_page, load_keyset_page
+from app.services.qr_cache import invalidate_qr
+from app.services.roster import roster_cache
+
+SEARCH_DEBOUNCE_SECONDS = 0.25
+ATHLETE_COUNT_CAP = 500
 
 
 class AthleteState(rx.State):
     athletes: list[Athlete] = []
+    athlete_count: int = 0
+    athlete_count_capped: bool = False
+    page_size: int = 24
+    page_number: int = 1
+    has_next_page: bool = False
+    has_prev_page: bool = False
+    _page_start: Optional[tuple[str, int]] = None
+    _page_end: Optional[tuple[str, int]] = None
+    _search_seq: int = 0
     available_age_categories: list[AgeCategory] = []
     available_belts: list[BeltRank] = []
     search_query: str = ""
@@ -26,43 +50,138 @@ class AthleteState(rx.State):
     is_upload_open: bool = False
     upload_error: str = ""
     upload_success: str = ""
+    is_importing: bool = False
+    import_parsed: int = 0
+    import_inserted: int = 0
+    import_merged: int = 0
+    import_skipped: int = 0
+    import_rejected: int = 0
 
     @rx.event
     async def load_athletes(self):
-        query = sqlmodel.select(Athlete).where(Athlete.is_active == True)
-        if self.search_query:
-            query = query.where(Athlete.full_name.contains(self.search_query))
-        if self.filter_age_category_id and self.filter_age_category_id != "all":
-            query = query.where(
-                Athlete.age_category_id == int(self.filter_age_category_id)
-            )
-        if self.filter_belt_rank_id and self.filter_belt_rank_id != "all":
-            query = query.where(
-                Athlete.current_belt_rank_id == int(self.filter_belt_rank_id)
-            )
         with rx.session() as session:
-            self.athletes = session.exec(query).all()
             self.available_age_categories = session.exec(
                 sqlmodel.select(AgeCategory)
             ).all()
             self.available_belts = session.exec(
                 sqlmodel.select(BeltRank).order_by(BeltRank.rank_order)
             ).all()
+        self._load_page(self._page_start, inclusive=True)
+
+    def _athlete_filters(self, broad: bool = False) -> list:
+        filters = [Athlete.is_active == True]
+        if broad:
+            filters.append(athlete_search_filter(self.search_query, broad=True))
+        elif self.search_query.strip():
+            # Mark the active check as likely so SQLite drives the lookup from
+            # the search index instead of scanning every active athlete.
+            filters = [
+                sqlmodel.func.likely(Athlete.is_active == True),
+                athlete_search_filter(self.search_query),
+            ]
+        if self.filter_age_category_id and self.filter_age_category_id != "all":
+            filters.append(Athlete.age_category_id == int(self.filter_age_category_id))
+        if self.filter_belt_rank_id and self.filter_belt_rank_id != "all":
+            filters.append(
+                Athlete.current_belt_rank_id == int(self.filter_belt_rank_id)
+            )
+        return filters
+
+    def _load_page(
+        self,
+        cursor: Optional[tuple[str, int]] = None,
+        backwards: bool = False,
+        inclusive: bool = False,
+    ):
+        """Load one page of athletes ordered by (full_name, id) relative to a cursor."""
+        self.athletes = load_keyset_page(
+            self,
+            self._fetch_page,
+            lambda athlete: (athlete.full_name, athlete.id),
+            cursor,
+            backwards=backwards,
+            inclusive=inclusive,
+        )
+
+    def _fetch_page(
+        self, cursor: Optional[tuple[str, int]], backwards: bool, inclusive: bool
+    ) -> tuple[list[Athlete], bool]:
+        """Fetch a page of athletes and refresh the count.
+
+        Searches are counted only up to ATHLETE_COUNT_CAP; an exact count of
+        a broad search would read every matching athlete.
+        """
+        with rx.session() as session:
+            broad = is_broad_search(session, self.search_query)
+            filters = self._athlete_filters(broad)
+            rows, has_more = fetch_keyset_page(
+                session,
+                sqlmodel.select(Athlete).where(*filters),
+                [Athlete.full_name, Athlete.id],
+                self.page_size,
+                cursor=cursor,
+                backwards=backwards,
+                inclusive=inclusive,
+            )
+            if broad:
+                count = count_broad_search(
+                    session, self.search_query, filters, ATHLETE_COUNT_CAP + 1
+                )
+            else:
+                matches = sqlmodel.select(Athlete.id).where(*filters)
+                if self.search_query.strip():
+                    matches = matches.limit(ATHLETE_COUNT_CAP + 1)
+                count = session.exec(
+                    sqlmodel.select(sqlmodel.func.count()).select_from(
+                        matches.subquery()
+                    )
+                ).one()
+        self.athlete_count_capped = (
+            bool(self.search_query.strip()) and count > ATHLETE_COUNT_CAP
+        )
+        self.athlete_count = ATHLETE_COUNT_CAP if self.athlete_count_capped else count
+        return rows, has_more
+
+    @rx.var
+    def athlete_count_label(self) -> str:
+        if self.athlete_count_capped:
+            return f"{self.athlete_count}+"
+        return str(self.athlete_count)
+
+    @rx.event
+    def next_page(self):
+        if self.has_next_page and self._page_end:
+            self._load_page(self._page_end)
+
+    @rx.event
+    def prev_page(self):
+        if self.has_prev_page and self._page_start:
+            self._load_page(self._page_start, backwards=True)
 
     @rx.event
     def set_search(self, query: str):
         self.search_query = query
-        return AthleteState.load_athletes
+        self._search_seq += 1
+        return AthleteState.run_search(self._search_seq)
+
+    @rx.event(background=True)
+    async def run_search(self, seq: int):
+        """Run the search once typing pauses, skipping superseded keystrokes."""
+        await asyncio.sleep(SEARCH_DEBOUNCE_SECONDS)
+        async with self:
+            if seq != self._search_seq:
+                return
+            self._load_page()
 
     @rx.event
     def set_filter_age(self, value: str):
         self.filter_age_category_id = value
-        return AthleteState.load_athletes
+        self._load_page()
 
     @rx.event
     def set_filter_belt(self, value: str):
         self.filter_belt_rank_id = value
-        return AthleteState.load_athletes
+        self._load_page()
 
     @rx.event
     def open_add_modal(self):
@@ -99,8 +218,14 @@ class AthleteState(rx.State):
     @rx.event
     def open_upload_modal(self):
         self.is_upload_open = True
-        self.upload_error = ""
-        self.upload_success = ""
+        if not self.is_importing:
+            self.upload_error = ""
+            self.upload_success = ""
+            self.import_parsed = 0
+            self.import_inserted = 0
+            self.import_merged = 0
+            self.import_skipped = 0
+            self.import_rejected = 0
 
     @rx.event
     def close_upload_modal(self):
@@ -108,37 +233,56 @@ class AthleteState(rx.State):
 
     @rx.event
     async def handle_upload(self, files: list[rx.UploadFile]):
-        if not files:
+        if not files or self.is_importing:
             return
         try:
-            file = files[0]
-            upload_data = await file.read()
-            csv_text = upload_data.decode("utf-8")
-            csv_reader = csv.DictReader(io.StringIO(csv_text))
-            added_count = 0
-            with rx.session() as session:
-                for row in csv_reader:
-                    if not row.get("full_name"):
-                        continue
-                    athlete = Athlete(
-                        full_name=row.get("full_name", ""),
-                        date_of_birth=row.get("date_of_birth", ""),
-                        gender=row.get("gender", "Male"),
-                        phone=row.get("phone", ""),
-                        guardian_name=row.get("guardian_name", ""),
-                        guardian_phone=row.get("guardian_phone", ""),
-                        is_active=True,
-                    )
-                    session.add(athlete)
-                    added_count += 1
-                session.commit()
-            self.upload_success = f"Successfully imported {added_count} athletes."
-            self.upload_error = ""
-            return AthleteState.load_athletes
+            path = await spool_upload(files[0], suffix=".csv")
         except Exception as e:
-            logging.exception(f"Error importing CSV: {e}")
+            logging.exception(f"Error receiving CSV: {e}")
             self.upload_error = f"Error importing CSV: {str(e)}"
             self.upload_success = ""
+            return
+        self.is_importing = True
+        self.import_parsed = 0
+        self.import_inserted = 0
+        self.import_merged = 0
+        self.import_skipped = 0
+        self.import_rejected = 0
+        self.upload_error = ""
+        self.upload_success = ""
+        return AthleteState.import_athletes(str(path))
+
+    @rx.event(background=True)
+    async def import_athletes(self, path: str):
+        """Stream a spooled CSV into the database in batches, reporting progress."""
+        try:
+            with open(path, newline="", encoding="utf-8-sig") as csv_file:
+                rows = iter(csv.DictReader(csv_file))
+                while True:
+                    result = await asyncio.to_thread(import_next_batch, rows)
+                    if not result.parsed:
+                        break
+                    async with self:
+                        self.import_parsed += result.parsed
+                        self.import_inserted += result.inserted
+                        self.import_merged += result.merged
+                        self.import_skipped += result.skipped
+                        self.import_rejected += result.rejected
+            async with self:
+                self.upload_success = (
+                    f"Imported {self.import_inserted} new athletes, merged"
+                    f" {self.import_merged} and skipped {self.import_skipped}"
+                    f" duplicates ({self.import_rejected} rows rejected)."
+                )
+        except Exception as e:
+            logging.exception(f"Error importing CSV: {e}")
+            async with self:
+                self.upload_error = f"Error importing CSV: {str(e)}"
+        finally:
+            os.unlink(path)
+            async with self:
+                self.is_importing = False
+        return AthleteState.load_athletes
 
     @rx.event
     async def save_athlete(self):
@@ -153,17 +297,34 @@ class AthleteState(rx.State):
                 if self.form_belt_rank_id and self.form_belt_rank_id != ""
                 else None
             )
+            fingerprint = athlete_fingerprint(
+                self.form_full_name, self.form_dob, self.form_phone
+            )
+            athlete = None
             if self.current_athlete_id:
                 athlete = session.get(Athlete, self.current_athlete_id)
-                if athlete:
-                    athlete.full_name = self.form_full_name
-                    athlete.date_of_birth = self.form_dob
-                    athlete.gender = self.form_gender
-                    athlete.phone = self.form_phone
-                    athlete.guardian_name = self.form_guardian
-                    athlete.age_category_id = age_cat_id
-                    athlete.current_belt_rank_id = belt_rank_id
-                    session.add(athlete)
+            else:
+                athlete = session.exec(
+                    sqlmodel.select(Athlete).where(Athlete.fingerprint == fingerprint)
+                ).first()
+                if athlete and athlete.is_active:
+                    return rx.toast(
+                        "An athlete with the same name, date of birth and phone already exists."
+                    )
+            renamed_from = None
+            if athlete:
+                if athlete.full_name != self.form_full_name:
+                    renamed_from = (athlete.id, athlete.full_name)
+                athlete.full_name = self.form_full_name
+                athlete.date_of_birth = self.form_dob
+                athlete.gender = self.form_gender
+                athlete.phone = self.form_phone
+                athlete.guardian_name = self.form_guardian
+                athlete.age_category_id = age_cat_id
+                athlete.current_belt_rank_id = belt_rank_id
+                athlete.fingerprint = fingerprint
+                athlete.is_active = True
+                session.add(athlete)
             else:
                 new_athlete = Athlete(
                     full_name=self.form_full_name,
@@ -173,9 +334,13 @@ class AthleteState(rx.State):
                     guardian_name=self.form_guardian,
                     age_category_id=age_cat_id,
                     current_belt_rank_id=belt_rank_id,
+                    fingerprint=fingerprint,
                 )
                 session.add(new_athlete)
             session.commit()
+        if renamed_from:
+            invalidate_qr(*renamed_from)
+        roster_cache.invalidate()
         self.is_open = False
         return AthleteState.load_athletes
 
@@ -187,4 +352,5 @@ class AthleteState(rx.State):
                 athlete.is_active = False
                 session.add(athlete)
                 session.commit()
+        roster_cache.invalidate()
         return AthleteState.load_athletes
\ No newline at end of file
@@ -1,9 +1,10 @@
 import reflex as rx
 from typing import Optional
-from app.models import Athlete, Attendance
+from app.models import Athlete, Attendance, BeltRank
 import sqlmodel
 import datetime
 import logging
+from app.services.attendance import attendance_records, upsert_attendance
 
 
 class AttendanceItem(rx.Base):
@@ -23,61 +24,80 @@ class AttendanceState(rx.State):
     absent_count: int = 0
     late_count: int = 0
     total_count: int = 0
+    selected_ids: list[int] = []
+    bulk_status: str = "Present"
+    _item_index: dict[int, int] = {}
 
     @rx.event
     async def load_today_status(self):
-        query_date = datetime.datetime.fromisoformat(self.checkin_date)
+        query_day = datetime.date.fromisoformat(self.checkin_date)
         with rx.session() as session:
-            athletes = session.exec(
-                sqlmodel.select(Athlete)
-                .where(Athlete.is_active == True)
-                .order_by(Athlete.full_name)
-            ).all()
-            attendance_records = session.exec(
-                sqlmodel.select(Attendance).where(
-                    (Attendance.date >= query_date)
-                    & (Attendance.date < query_date + datetime.timedelta(days=1))
-                )
-            ).all()
-            attendance_map = {r.athlete_id: r for r in attendance_records}
-            from app.models import BeltRank
-
-            belts = {
-                b.id: b.name for b in session.exec(sqlmodel.select(BeltRank)).all()
-            }
-            items = []
-            present = 0
-            absent = 0
-            late = 0
-            for athlete in athletes:
-                record = attendance_map.get(athlete.id)
-                status = record.status if record else "None"
-                if status == "Present":
-                    present += 1
-                elif status == "Absent":
-                    absent += 1
-                elif status == "Late":
-                    late += 1
-                belt_name = (
-                    belts.get(athlete.current_belt_rank_id, "Unranked")
-                    if athlete.current_belt_rank_id
-                    else "Unranked"
+            rows = session.exec(
+                sqlmodel.select(
+                    Athlete.id,
+                    Athlete.full_name,
+                    BeltRank.name,
+                    Attendance.id,
+                    Attendance.status,
+                    Attendance.class_time,
                 )
-                items.append(
-                    AttendanceItem(
-                        athlete_id=athlete.id,
-                        full_name=athlete.full_name,
-                        belt_name=belt_name,
-                        status=status,
-                        time=record.class_time if record and record.class_time else "",
-                        record_id=record.id if record else None,
-                    )
+                .select_from(Athlete)
+                .outerjoin(BeltRank, BeltRank.id == Athlete.current_belt_rank_id)
+                .outerjoin(
+                    Attendance,
+                    (Attendance.athlete_id == Athlete.id)
+                    & (Attendance.day == query_day),
                 )
-            self.total_count = len(athletes)
-            self.present_count = present
-            self.absent_count = absent
-            self.late_count = late
-            self.today_attendance = items
+                .where(Athlete.is_active == True)
+                .order_by(Athlete.full_name, Athlete.id, Attendance.id)
+            ).all()
+        items: dict[int, AttendanceItem] = {}
+        for athlete_id, full_name, belt_name, record_id, status, class_time in rows:
+            items[athlete_id] = AttendanceItem(
+                athlete_id=athlete_id,
+                full_name=full_name,
+                belt_name=belt_name or "Unranked",
+                status=status or "None",
+                time=class_time or "",
+                record_id=record_id,
+            )
+        self.today_attendance = list(items.values())
+        self._item_index = {
+            item.athlete_id: position
+            for position, item in enumerate(self.today_attendance)
+        }
+        self.total_count = len(self.today_attendance)
+        self.present_count = 0
+        self.absent_count = 0
+        self.late_count = 0
+        for item in self.today_attendance:
+            self._count_status(item.status, 1)
+
+    def _count_status(self, status: str, delta: int):
+        if status == "Present":
+            self.present_count += delta
+        elif status == "Absent":
+            self.absent_count += delta
+        elif status == "Late":
+            self.late_count += delta
+
+    def _apply_status(self, athlete_id: int, record: Optional[Attendance]):
+        """Update one board item and the counters from its saved record."""
+        position = self._item_index.get(athlete_id)
+        if position is None:
+            return
+        item = self.today_attendance[position]
+        self._count_status(item.status, -1)
+        updated = AttendanceItem(
+            athlete_id=item.athlete_id,
+            full_name=item.full_name,
+            belt_name=item.belt_name,
+            status=record.status if record else "None",
+            time=(record.class_time or "") if record else "",
+            record_id=record.id if record else None,
+        )
+        self._count_status(updated.status, 1)
+        self.today_attendance[position] = updated
 
     @rx.event
     def set_search_query(self, query: str):
@@ -86,39 +106,61 @@ class AttendanceState(rx.State):
     @rx.event
     def set_checkin_date(self, date: str):
         self.checkin_date = date
+        self.selected_ids = []
         return AttendanceState.load_today_status
 
     @rx.event
     async def mark_status(self, athlete_id: int, status: str):
-        query_date = datetime.datetime.fromisoformat(self.checkin_date)
+        await self._mark_many([athlete_id], status)
+
+    @rx.event
+    async def mark_all(self, status: str):
+        await self._mark_many(
+            [item.athlete_id for item in self.today_attendance], status
+        )
+
+    @rx.event
+    async def mark_selected(self, status: str):
+        await self._mark_many(list(self.selected_ids), status)
+        self.selected_ids = []
+
+    @rx.event
+    async def mark_filtered(self, status: str):
+        await self._mark_many(
+            [item.athlete_id for item in self.filtered_attendance], status
+        )
+
+    async def _mark_many(self, athlete_ids: list[int], status: str):
+        """Upsert one status for these athletes in one transaction and patch their rows."""
+        if not athlete_ids:
+            return
+        query_day = datetime.date.fromisoformat(self.checkin_date)
         now_time = datetime.datetime.now().strftime("%H:%M")
         try:
             with rx.session() as session:
-                existing = session.exec(
-                    sqlmodel.select(Attendance).where(
-                        (Attendance.athlete_id == athlete_id)
-                        & (Attendance.date >= query_date)
-                        & (Attendance.date < query_date + datetime.timedelta(days=1))
-                    )
-                ).first()
-                if existing:
-                    existing.status = status
-                    if status != "None":
-                        existing.class_time = now_time
-                    session.add(existing)
-                elif status != "None":
-                    new_record = Attendance(
-                        athlete_id=athlete_id,
-                        date=query_date,
-                        status=status,
-                        class_time=now_time,
-                    )
-                    session.add(new_record)
+                upsert_attendance(session, athlete_ids, query_day, status, now_time)
                 session.commit()
-            return AttendanceState.load_today_status
+                records = attendance_records(session, athlete_ids, query_day)
+            for athlete_id in athlete_ids:
+                self._apply_status(athlete_id, records.get(athlete_id))
         except Exception as e:
             logging.exception(f"Error marking attendance: {e}")
 
+    @rx.event
+    def toggle_selected(self, athlete_id: int):
+        if athlete_id in self.selected_ids:
+            self.selected_ids.remove(athlete_id)
+        else:
+            self.selected_ids.append(athlete_id)
+
+    @rx.event
+    def clear_selection(self):
+        self.selected_ids = []
+
+    @rx.event
+    def set_bulk_status(self, status: str):
+        self.bulk_status = status
+
     @rx.var
     def filtered_attendance(self) -> list[AttendanceItem]:
         if not self.search_query:
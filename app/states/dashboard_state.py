@@ -1,8 +1,10 @@
 import reflex as rx
-from app.models import Athlete, Coach, Payment
+from app.models import Athlete
 import datetime
 import sqlmodel
+from app.i18n import DEFAULT_LANGUAGE, TRANSLATIONS
 from app.states.language_state import LanguageState
+from app.services.dashboard_metrics import load_dashboard_metrics
 
 
 class DashboardState(rx.State):
@@ -16,39 +18,27 @@ class DashboardState(rx.State):
     @rx.event
     async def load_stats(self):
         with rx.session() as session:
-            self.total_athletes = (
-                session.exec(sqlmodel.select(Athlete).where(Athlete.is_active == True))
-                .all()
-                .__len__()
-            )
-            self.active_coaches = (
-                session.exec(sqlmodel.select(Coach).where(Coach.is_active == True))
-                .all()
-                .__len__()
-            )
             now = datetime.datetime.now()
-            payments = session.exec(
-                sqlmodel.select(Payment).where(
-                    (Payment.month_covered == now.month)
-                    & (Payment.year_covered == now.year)
-                )
-            ).all()
-            self.monthly_revenue = sum([p.amount for p in payments])
+            metrics = load_dashboard_metrics(session, now.month, now.year)
+            self.total_athletes = metrics.total_athletes
+            self.active_coaches = metrics.active_coaches
+            self.monthly_revenue = metrics.monthly_revenue
+            self.unpaid_count = metrics.unpaid_count
             self.recent_athletes = session.exec(
                 sqlmodel.select(Athlete)
                 .where(Athlete.is_active == True)
                 .order_by(Athlete.joined_date.desc())
                 .limit(5)
             ).all()
-            paid_athlete_ids = set([p.athlete_id for p in payments])
-            self.unpaid_count = max(0, self.total_athletes - len(paid_athlete_ids))
         if not self.notifications_checked and self.unpaid_count > 0:
             self.notifications_checked = True
             lang_state = await self.get_state(LanguageState)
-            alert_msg = lang_state.translations[lang_state.current_lang]["unpaid_alert"]
+            strings = TRANSLATIONS.get(
+                lang_state.current_lang, TRANSLATIONS[DEFAULT_LANGUAGE]
+            )
             yield rx.toast(
-                f"{self.unpaid_count} {alert_msg}",
-                title=lang_state.translations[lang_state.current_lang]["notifications"],
+                f"{self.unpaid_count} {strings['unpaid_alert']}",
+                title=strings["notifications"],
                 duration=5000,
                 close_button=True,
                 position="bottom-right",
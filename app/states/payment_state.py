@@ -1,15 +1,15 @@
 import reflex as rx
 from typing import Optional
-from app.models import Payment, Athlete, Setting
+from app.models import Payment, Athlete
 import sqlmodel
 from sqlmodel import select
 import datetime
-import os
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import cm
 import logging
+from app.services.athlete_search import athlete_search_filter
+from app.services.pagination import fetch_keyset_page, load_keyset_page
+from app.services.payment_metrics import load_payment_totals
+from app.services.receipts import ensure_receipts_pdf, receipt_fields
+from app.services.settings import monthly_fee, yearly_license
 
 
 class PaymentData(rx.Base):
@@ -24,10 +24,33 @@ class PaymentData(rx.Base):
     notes: str
 
 
+def _payment_data(payment: Payment, athlete_name: str) -> PaymentData:
+    month_year = "-"
+    if payment.month_covered and payment.year_covered:
+        month_year = f"{datetime.date(2000, payment.month_covered, 1).strftime('%B')} {payment.year_covered}"
+    return PaymentData(
+        id=payment.id,
+        athlete_id=payment.athlete_id,
+        athlete_name=athlete_name,
+        amount=payment.amount,
+        payment_type=payment.payment_type,
+        status=payment.status,
+        payment_date=payment.payment_date.strftime("%Y-%m-%d"),
+        month_year=month_year,
+        notes=payment.notes or "",
+    )
+
+
 class PaymentState(rx.State):
     payments: list[PaymentData] = []
     athletes: list[Athlete] = []
-    filtered_payments: list[PaymentData] = []
+    payment_count: int = 0
+    page_size: int = 24
+    page_number: int = 1
+    has_next_page: bool = False
+    has_prev_page: bool = False
+    _page_start: Optional[tuple[datetime.datetime, int]] = None
+    _page_end: Optional[tuple[datetime.datetime, int]] = None
     search_query: str = ""
     status_filter: str = "all"
     type_filter: str = "all"
@@ -53,61 +76,84 @@ class PaymentState(rx.State):
                 .where(Athlete.is_active == True)
                 .order_by(Athlete.full_name)
             ).all()
-            query = select(Payment, Athlete).where(Payment.athlete_id == Athlete.id)
-            results = session.exec(query).all()
-            self.payments = []
-            now = datetime.datetime.now()
-            current_month_revenue = 0.0
-            total_inc = 0.0
-            unpaid = 0
-            for payment, athlete in results:
-                month_year = "-"
-                if payment.month_covered and payment.year_covered:
-                    month_year = f"{datetime.date(2000, payment.month_covered, 1).strftime('%B')} {payment.year_covered}"
-                p_data = PaymentData(
-                    id=payment.id,
-                    athlete_id=athlete.id,
-                    athlete_name=athlete.full_name,
-                    amount=payment.amount,
-                    payment_type=payment.payment_type,
-                    status=payment.status,
-                    payment_date=payment.payment_date.strftime("%Y-%m-%d"),
-                    month_year=month_year,
-                    notes=payment.notes or "",
-                )
-                self.payments.append(p_data)
-                total_inc += (
-                    payment.amount if payment.status in ["Paid", "Partial"] else 0
-                )
-                if (
-                    payment.month_covered == now.month
-                    and payment.year_covered == now.year
-                ):
-                    current_month_revenue += (
-                        payment.amount if payment.status in ["Paid", "Partial"] else 0
+            self._refresh_totals(session)
+        self._load_page(self._page_start, inclusive=True)
+
+    def _payment_filters(self) -> list:
+        filters = []
+        if self.search_query.strip():
+            filters.append(
+                Payment.athlete_id.in_(
+                    select(Athlete.id).where(
+                        athlete_search_filter(self.search_query, "full_name")
                     )
-                if payment.status in ["Unpaid", "Overdue"]:
-                    unpaid += 1
-            self.total_income = total_inc
-            self.monthly_revenue = current_month_revenue
-            self.unpaid_count = unpaid
-            self.payments.sort(key=lambda x: x.payment_date, reverse=True)
-            self.filter_payments()
+                )
+            )
+        if self.status_filter != "all":
+            filters.append(Payment.status == self.status_filter)
+        if self.type_filter != "all":
+            filters.append(Payment.payment_type == self.type_filter)
+        return filters
+
+    def _load_page(
+        self,
+        cursor: Optional[tuple[datetime.datetime, int]] = None,
+        backwards: bool = False,
+        inclusive: bool = False,
+    ):
+        """Load one page of payments, newest first, relative to a cursor."""
+        rows = load_keyset_page(
+            self,
+            self._fetch_page,
+            lambda row: (row[0].payment_date, row[0].id),
+            cursor,
+            backwards=backwards,
+            inclusive=inclusive,
+        )
+        self.payments = [
+            _payment_data(payment, athlete_name) for payment, athlete_name in rows
+        ]
+
+    def _fetch_page(
+        self,
+        cursor: Optional[tuple[datetime.datetime, int]],
+        backwards: bool,
+        inclusive: bool,
+    ) -> tuple[list, bool]:
+        filters = self._payment_filters()
+        with rx.session() as session:
+            rows, has_more = fetch_keyset_page(
+                session,
+                select(Payment, Athlete.full_name)
+                .join(Athlete, Athlete.id == Payment.athlete_id)
+                .where(*filters),
+                [Payment.payment_date, Payment.id],
+                self.page_size,
+                cursor=cursor,
+                backwards=backwards,
+                inclusive=inclusive,
+                descending=True,
+            )
+            self.payment_count = session.exec(
+                select(sqlmodel.func.count(Payment.id))
+                .join(Athlete, Athlete.id == Payment.athlete_id)
+                .where(*filters)
+            ).one()
+        return rows, has_more
+
+    @rx.event
+    def next_page(self):
+        if self.has_next_page and self._page_end:
+            self._load_page(self._page_end)
+
+    @rx.event
+    def prev_page(self):
+        if self.has_prev_page and self._page_start:
+            self._load_page(self._page_start, backwards=True)
 
     @rx.event
     def filter_payments(self):
-        filtered = self.payments
-        if self.search_query:
-            filtered = [
-                p
-                for p in filtered
-                if self.search_query.lower() in p.athlete_name.lower()
-            ]
-        if self.status_filter != "all":
-            filtered = [p for p in filtered if p.status == self.status_filter]
-        if self.type_filter != "all":
-            filtered = [p for p in filtered if p.payment_type == self.type_filter]
-        self.filtered_payments = filtered
+        self._load_page()
 
     @rx.event
     def set_search(self, query: str):
@@ -152,11 +198,20 @@ class PaymentState(rx.State):
         except ValueError as e:
             logging.exception(f"Error: {e}")
 
+    @rx.event
+    def set_form_type(self, value: str):
+        self.form_type = value
+        if self.current_payment_id is None:
+            if value == "Monthly Fee":
+                self.form_amount = monthly_fee()
+            elif value == "Yearly License":
+                self.form_amount = yearly_license()
+
     @rx.event
     def open_add_modal(self):
         self.current_payment_id = None
         self.form_athlete_id = ""
-        self.form_amount = 500.0
+        self.form_amount = monthly_fee()
         self.form_type = "Monthly Fee"
         self.form_status = "Paid"
         self.form_date = datetime.date.today().isoformat()
@@ -200,8 +255,12 @@ class PaymentState(rx.State):
                 "status": self.form_status,
                 "notes": self.form_notes,
             }
+            old_key = None
             if self.current_payment_id:
                 payment = session.get(Payment, self.current_payment_id)
+                old_key = (payment.payment_date, payment.id)
+                if payment.payment_date.date() == data["payment_date"].date():
+                    del data["payment_date"]
                 for key, value in data.items():
                     setattr(payment, key, value)
                 session.add(payment)
@@ -209,8 +268,9 @@ class PaymentState(rx.State):
                 payment = Payment(**data)
                 session.add(payment)
             session.commit()
+            payment_id = payment.id
         self.is_open = False
-        return PaymentState.load_data
+        self._patch_row(payment_id, old_key)
 
     @rx.event
     async def delete_payment(self, id: int):
@@ -219,83 +279,88 @@ class PaymentState(rx.State):
             if payment:
                 session.delete(payment)
                 session.commit()
-        return PaymentState.load_data
+        self._patch_row(id)
+
+    def _refresh_totals(self, session):
+        now = datetime.datetime.now()
+        totals = load_payment_totals(session, now.month, now.year)
+        self.total_income = totals.total_income
+        self.monthly_revenue = totals.monthly_revenue
+        self.unpaid_count = totals.unpaid_count
+
+    def _patch_row(
+        self,
+        payment_id: int,
+        old_key: Optional[tuple[datetime.datetime, int]] = None,
+    ):
+        """Apply a single-payment change to the current page without reloading it.
+
+        Falls back to reloading the page when the row moves to another position.
+        """
+        with rx.session() as session:
+            row = session.exec(
+                select(Payment, Athlete.full_name)
+                .join(Athlete, Athlete.id == Payment.athlete_id)
+                .where(Payment.id == payment_id, *self._payment_filters())
+            ).first()
+            self._refresh_totals(session)
+        index = next(
+            (i for i, p in enumerate(self.payments) if p.id == payment_id), None
+        )
+        if row is None:
+            if index is not None:
+                del self.payments[index]
+                self.payment_count -= 1
+            return
+        payment, athlete_name = row
+        key = (payment.payment_date, payment.id)
+        if index is not None and key == old_key:
+            self.payments[index] = _payment_data(payment, athlete_name)
+        elif (
+            old_key is None
+            and self.page_number == 1
+            and (self._page_start is None or key > self._page_start)
+        ):
+            self.payments.insert(0, _payment_data(payment, athlete_name))
+            self.payment_count += 1
+            self._page_start = key
+            if self._page_end is None:
+                self._page_end = key
+        else:
+            self._load_page(self._page_start, inclusive=True)
 
     @rx.event
     async def download_receipt(self, payment_id: int):
         try:
             with rx.session() as session:
                 payment = session.get(Payment, payment_id)
-                athlete = session.get(Athlete, payment.athlete_id)
+                athlete = session.get(Athlete, payment.athlete_id) if payment else None
                 if not payment or not athlete:
                     return
-                upload_dir = rx.get_upload_dir()
-                upload_dir.mkdir(parents=True, exist_ok=True)
-                filename = f"receipt_{payment.id}_{datetime.datetime.now().strftime('%Y%m%d')}.pdf"
-                file_path = upload_dir / filename
-                c = canvas.Canvas(file_path, pagesize=A4)
-                width, height = A4
-                red_color = colors.HexColor("#DC2626")
-                dark_gray = colors.HexColor("#1F2937")
-                c.setFillColor(red_color)
-                c.rect(0, height - 3 * cm, width, 3 * cm, fill=1, stroke=0)
-                c.setFillColor(colors.white)
-                c.setFont("Helvetica-Bold", 24)
-                c.drawString(2 * cm, height - 1.8 * cm, "GALIA CLUB KARATE")
-                c.setFont("Helvetica", 12)
-                c.drawString(2 * cm, height - 2.5 * cm, "Official Payment Receipt")
-                c.setFillColor(dark_gray)
-                c.setFont("Helvetica", 10)
-                c.drawString(
-                    width - 7 * cm, height - 4.5 * cm, f"Receipt #: {payment.id:06d}"
-                )
-                c.drawString(
-                    width - 7 * cm,
-                    height - 5 * cm,
-                    f"Date: {datetime.datetime.now().strftime('%Y-%m-%d')}",
-                )
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(2 * cm, height - 5 * cm, "Received From:")
-                c.setFont("Helvetica", 12)
-                c.drawString(2 * cm, height - 5.7 * cm, athlete.full_name)
-                if athlete.age_category_id:
-                    pass
-                table_y = height - 8 * cm
-                c.setStrokeColor(colors.lightgrey)
-                c.line(2 * cm, table_y, width - 2 * cm, table_y)
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(2.5 * cm, table_y - 0.8 * cm, "Description")
-                c.drawString(width - 5 * cm, table_y - 0.8 * cm, "Amount")
-                c.line(2 * cm, table_y - 1.2 * cm, width - 2 * cm, table_y - 1.2 * cm)
-                c.setFont("Helvetica", 10)
-                desc = f"{payment.payment_type}"
-                if payment.month_covered:
-                    month_name = datetime.date(2000, payment.month_covered, 1).strftime(
-                        "%B"
-                    )
-                    desc += f" - {month_name} {payment.year_covered}"
-                c.drawString(2.5 * cm, table_y - 2 * cm, desc)
-                c.drawString(
-                    width - 5 * cm, table_y - 2 * cm, f"{payment.amount:,.2f} DA"
-                )
-                c.line(2 * cm, table_y - 3 * cm, width - 2 * cm, table_y - 3 * cm)
-                c.setFont("Helvetica-Bold", 12)
-                c.drawString(width - 8 * cm, table_y - 4 * cm, "Total Paid:")
-                c.setFillColor(red_color)
-                c.drawString(
-                    width - 5 * cm, table_y - 4 * cm, f"{payment.amount:,.2f} DA"
-                )
-                c.setFillColor(colors.gray)
-                c.setFont("Helvetica-Oblique", 8)
-                c.drawCentredString(
-                    width / 2,
-                    2 * cm,
-                    "Thank you for your payment. Keep this receipt for your records.",
-                )
-                c.drawCentredString(
-                    width / 2, 1.5 * cm, "Galia Club Manager - Generated System Receipt"
-                )
-                c.save()
-                return rx.download(url=f"/_upload/{filename}")
+                fields = receipt_fields(payment, athlete)
+            url = await ensure_receipts_pdf([fields])
+            return rx.download(url=url)
+        except Exception as e:
+            logging.exception(f"PDF Generation Error: {e}")
+
+    @rx.event
+    async def download_page_receipts(self):
+        """Print the receipts of every payment on the current page as one PDF."""
+        if not self.payments:
+            return
+        try:
+            with rx.session() as session:
+                rows = session.exec(
+                    select(Payment, Athlete)
+                    .join(Athlete, Athlete.id == Payment.athlete_id)
+                    .where(Payment.id.in_([p.id for p in self.payments]))
+                ).all()
+                by_id = {
+                    payment.id: receipt_fields(payment, athlete)
+                    for payment, athlete in rows
+                }
+            receipts = [by_id[p.id] for p in self.payments if p.id in by_id]
+            url = await ensure_receipts_pdf(receipts)
+            return rx.download(url=url)
         except Exception as e:
             logging.exception(f"PDF Generation Error: {e}")
\ No newline at end of file
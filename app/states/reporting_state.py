@@ -3,20 +3,19 @@ from typing import Optional
 from app.models import (
     Athlete,
     Payment,
-    Attendance,
     BeltPromotion,
     Competition,
-    CompetitionResult,
+    DailyAttendanceSummary,
 )
 import sqlmodel
 import datetime
-import csv
-import io
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 from reportlab.lib.units import cm
 import logging
+from app.services.download_tokens import backend_url, issue_token
+from app.services.report_export import REPORT_TYPES
 
 
 class ReportingState(rx.State):
@@ -42,15 +41,20 @@ class ReportingState(rx.State):
                     (p.amount for p in payments if p.status in ["Paid", "Partial"])
                 )
                 thirty_days_ago = datetime.datetime.now() - datetime.timedelta(days=30)
-                attendance_records = session.exec(
-                    sqlmodel.select(Attendance).where(
-                        Attendance.date >= thirty_days_ago
-                    )
-                ).all()
-                present = sum(
-                    (1 for a in attendance_records if a.status in ["Present", "Late"])
-                )
-                total_records = len(attendance_records)
+                present, total_records = session.exec(
+                    sqlmodel.select(
+                        sqlmodel.func.coalesce(
+                            sqlmodel.func.sum(
+                                DailyAttendanceSummary.present
+                                + DailyAttendanceSummary.late
+                            ),
+                            0,
+                        ),
+                        sqlmodel.func.coalesce(
+                            sqlmodel.func.sum(DailyAttendanceSummary.total), 0
+                        ),
+                    ).where(DailyAttendanceSummary.day >= thirty_days_ago.date())
+                ).one()
                 self.attendance_rate = (
                     round(present / total_records * 100, 1)
                     if total_records > 0
@@ -79,67 +83,22 @@ class ReportingState(rx.State):
 
     @rx.event
     async def generate_csv(self):
-        output = io.StringIO()
-        writer = csv.writer(output)
         try:
-            with rx.session() as session:
-                start = datetime.datetime.strptime(self.start_date, "%Y-%m-%d")
-                end = datetime.datetime.strptime(
-                    self.end_date, "%Y-%m-%d"
-                ) + datetime.timedelta(days=1)
-                if self.report_type == "Athletes":
-                    writer.writerow(["ID", "Full Name", "Gender", "Phone", "Belt Rank"])
-                    athletes = session.exec(
-                        sqlmodel.select(Athlete).where(Athlete.is_active == True)
-                    ).all()
-                    for a in athletes:
-                        writer.writerow(
-                            [
-                                a.id,
-                                a.full_name,
-                                a.gender,
-                                a.phone,
-                                a.current_belt_rank_id,
-                            ]
-                        )
-                elif self.report_type == "Payments":
-                    writer.writerow(
-                        ["ID", "Athlete ID", "Amount", "Type", "Date", "Status"]
-                    )
-                    payments = session.exec(
-                        sqlmodel.select(Payment).where(
-                            (Payment.payment_date >= start)
-                            & (Payment.payment_date < end)
-                        )
-                    ).all()
-                    for p in payments:
-                        writer.writerow(
-                            [
-                                p.id,
-                                p.athlete_id,
-                                p.amount,
-                                p.payment_type,
-                                p.payment_date,
-                                p.status,
-                            ]
-                        )
-                elif self.report_type == "Attendance":
-                    writer.writerow(["Date", "Athlete ID", "Status", "Time"])
-                    attendance = session.exec(
-                        sqlmodel.select(Attendance).where(
-                            (Attendance.date >= start) & (Attendance.date < end)
-                        )
-                    ).all()
-                    for a in attendance:
-                        writer.writerow([a.date, a.athlete_id, a.status, a.class_time])
-                elif self.report_type == "Competitions":
-                    writer.writerow(["Competition", "Athlete ID", "Result", "Category"])
-                    results = session.exec(sqlmodel.select(CompetitionResult)).all()
-                    for r in results:
-                        writer.writerow(
-                            [r.competition_id, r.athlete_id, r.result, r.category]
-                        )
+            start = datetime.datetime.strptime(self.start_date, "%Y-%m-%d")
+            end = datetime.datetime.strptime(
+                self.end_date, "%Y-%m-%d"
+            ) + datetime.timedelta(days=1)
+            if self.report_type not in REPORT_TYPES:
+                return rx.toast(f"Unknown report type: {self.report_type}")
             filename = f"report_{self.report_type.lower()}_{datetime.datetime.now().strftime('%Y%m%d')}.csv"
-            return rx.download(data=output.getvalue(), filename=filename)
+            token = issue_token(
+                "report",
+                report_type=self.report_type,
+                start=start.isoformat(),
+                end=end.isoformat(),
+                filename=filename,
+            )
+            url = backend_url(f"/api/reports/export?token={token}")
+            return rx.download(url=rx.Var.create(url), filename=filename)
         except Exception as e:
             logging.exception(f"CSV Generation Error: {e}")
\ No newline at end of file
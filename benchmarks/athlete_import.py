@@ -0,0 +1,142 @@
+"""Bulk CSV import throughput and memory for a large roster file.
+
+The CSV mixes new athletes with repeated rows, rows that differ only in the
+birth date format, rows for athletes already in the database and rows that
+fail validation. It is streamed through import_next_batch exactly as the
+upload handler does, once for throughput and RSS, then again into a fresh
+database under tracemalloc for the Python heap peak.
+
+Run from the repository root: python -m benchmarks.athlete_import
+"""
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from app.services.athlete_fingerprint import athlete_fingerprint
+from app.services.athlete_import import BatchResult, import_next_batch
+from benchmarks.common import peak_rss_mb, scratch_database
+
+FIELDS = ["full_name", "date_of_birth", "gender", "phone", "guardian_name"]
+INVALID_ROWS = [
+    {"full_name": "", "date_of_birth": "2012-01-01", "gender": "Male"},
+    {"full_name": "Unreadable Date", "date_of_birth": "soon", "gender": "Female"},
+    {"full_name": "Bad Date", "date_of_birth": "31/02/2012", "gender": "Male"},
+    {"full_name": "Bad Gender", "date_of_birth": "2012-01-01", "gender": "x"},
+]
+
+
+def athlete_row(number: int, day_first: bool = False) -> dict:
+    year, month, day = 2005 + number % 15, number % 12 + 1, number % 28 + 1
+    return {
+        "full_name": f"Athlete {number}",
+        "date_of_birth": (
+            f"{day:02d}/{month:02d}/{year}"
+            if day_first
+            else f"{year}-{month:02d}-{day:02d}"
+        ),
+        "gender": random.choice(["Male", "female", "M", "F"]),
+        "phone": f"0555{number:06d}",
+        "guardian_name": f"Guardian {number}",
+    }
+
+
+def write_csv(path: Path, rows: int, existing: int, duplicate_rate: float) -> dict:
+    """Write the import file; return the counts a correct import must report."""
+    expected = {"inserted": 0, "merged": 0, "skipped": 0, "rejected": 0}
+    seen = []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for index in range(rows):
+            roll = random.random()
+            if index % 25 == 24:
+                writer.writerow(random.choice(INVALID_ROWS))
+                expected["rejected"] += 1
+                continue
+            if seen and roll < duplicate_rate:
+                number = random.choice(seen)
+                writer.writerow(
+                    athlete_row(number, day_first=roll < duplicate_rate / 2)
+                )
+                expected["skipped"] += 1
+                continue
+            number = index
+            writer.writerow(athlete_row(number))
+            seen.append(number)
+            expected["merged" if number < existing else "inserted"] += 1
+    return expected
+
+
+def seed_existing(engine, count: int):
+    """Add inactive athletes without guardians, so the import merges into them."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO athlete (full_name, date_of_birth, gender, joined_date,"
+            " is_active, phone, fingerprint)"
+            " VALUES (?, ?, 'Male', '2024-01-01', 0, ?, ?)",
+            [
+                (
+                    row["full_name"],
+                    row["date_of_birth"],
+                    row["phone"],
+                    athlete_fingerprint(
+                        row["full_name"], row["date_of_birth"], row["phone"]
+                    ),
+                )
+                for row in map(athlete_row, range(count))
+            ],
+        )
+
+
+def run_import(path: Path) -> dict:
+    totals = dict.fromkeys(BatchResult._fields, 0)
+    with open(path, newline="", encoding="utf-8-sig") as csv_file:
+        rows = iter(csv.DictReader(csv_file))
+        while (result := import_next_batch(rows)).parsed:
+            for field, value in result._asdict().items():
+                totals[field] += value
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--existing", type=int, default=5000)
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    args = parser.parse_args()
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "athletes.csv"
+        expected = write_csv(path, args.rows, args.existing, args.duplicate_rate)
+        with scratch_database() as engine:
+            seed_existing(engine, args.existing)
+            baseline = peak_rss_mb()
+            started = time.perf_counter()
+            totals = run_import(path)
+            elapsed = time.perf_counter() - started
+            growth = peak_rss_mb() - baseline
+        with scratch_database() as engine:
+            seed_existing(engine, args.existing)
+            tracemalloc.start()
+            run_import(path)
+            heap_peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+    print(
+        f"imported {totals['parsed']} rows in {elapsed:.1f}s"
+        f" ({totals['parsed'] / elapsed:,.0f} rows/s)"
+    )
+    print(f"Python heap peak {heap_peak:.1f} MB, peak RSS growth {growth:.1f} MB")
+    print(f"{'':<10} {'reported':>9} {'expected':>9}")
+    for field in ("inserted", "merged", "skipped", "rejected"):
+        print(f"{field:<10} {totals[field]:>9} {expected[field]:>9}")
+    if any(totals[field] != expected[field] for field in expected):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Athlete search latency for terms that match a large share of the roster.
+
+Run from the repository root: python -m benchmarks.athlete_search
+"""
+
+import argparse
+import random
+from reflex.state import State
+from app.states.athlete_state import AthleteState
+from benchmarks.common import median_seconds, scratch_database
+
+FIRST_NAMES = ["Ali", "Salim", "Khalil", "Amina", "Sara", "Yacine", "Nadia", "Omar"]
+LAST_NAMES = ["Benali", "Haddad", "Saadi", "Mansouri", "Belkacem", "Alioui", "Zerrouk"]
+TERMS = ["ali", "Benali", "Sa", "0555", "Khalil Benali", "0661001234", "zzz"]
+
+
+def seed(engine, count: int):
+    """Add athletes whose names and phones overlap heavily, like a real club roster."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO athlete (full_name, date_of_birth, gender, joined_date,"
+            " is_active, phone, guardian_name)"
+            " VALUES (?, '2012-01-01', 'Male', '2024-01-01', 1, ?, ?)",
+            [
+                (
+                    f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
+                    f"{random.choice(['0555', '0661', '0770'])}{number:06d}",
+                    f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
+                )
+                for number in range(count)
+            ],
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--athletes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+    random.seed(0)
+    with scratch_database() as engine:
+        seed(engine, args.athletes)
+        root = State(_reflex_internal_init=True)
+        state = root.get_substate(AthleteState.get_full_name().split("."))
+        results = []
+        for term in TERMS:
+            state.search_query = term
+            first_page = median_seconds(state._load_page, args.repeat)
+            count_label = state.athlete_count_label
+            next_page = None
+            if state.has_next_page:
+                next_page = median_seconds(
+                    lambda cursor=state._page_end: state._load_page(cursor),
+                    args.repeat,
+                )
+            results.append((term, count_label, first_page, next_page))
+    print(f"{args.athletes} athletes")
+    print(f"{'term':<16} {'matches':>8} {'first page ms':>14} {'next page ms':>13}")
+    for term, count_label, first_page, next_page in results:
+        next_ms = f"{next_page * 1000:.1f}" if next_page is not None else "-"
+        print(f"{term:<16} {count_label:>8} {first_page * 1000:>14.1f} {next_ms:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Online backup time and peak RSS for a large database.
+
+Run from the repository root: python -m benchmarks.backup
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from app.services import backups
+from benchmarks.common import peak_rss_mb, scratch_database
+
+NOTE_BYTES = 1024
+ROWS_PER_BATCH = 10_000
+
+
+def grow_database(engine, size_mb: int):
+    """Add payments with half-compressible notes until the file reaches size_mb."""
+    path = backups.database_path()
+    while path.stat().st_size < size_mb * 1024 * 1024:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "INSERT INTO payment (athlete_id, amount, payment_type, payment_date,"
+                " month_covered, year_covered, status, notes)"
+                " VALUES (1, 500, 'Monthly Fee', '2024-05-05', 5, 2024, 'Paid', ?)",
+                [(os.urandom(NOTE_BYTES // 2).hex(),) for _ in range(ROWS_PER_BATCH)],
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    args = parser.parse_args()
+    with scratch_database() as engine, tempfile.TemporaryDirectory() as directory:
+        backups.BACKUP_DIR = Path(directory)
+        grow_database(engine, args.size_mb)
+        size_mb = backups.database_path().stat().st_size / (1024 * 1024)
+        results = []
+        for incremental in (False, True):
+            baseline = peak_rss_mb()
+            started = time.perf_counter()
+            archive = backups.create_backup(incremental=incremental)
+            elapsed = time.perf_counter() - started
+            results.append(
+                (
+                    archive.name,
+                    elapsed,
+                    archive.stat().st_size / (1024 * 1024),
+                    peak_rss_mb() - baseline,
+                )
+            )
+    print(f"database {size_mb:.0f} MB")
+    print(f"{'backup':<32} {'seconds':>8} {'archive MB':>11} {'RSS growth MB':>14}")
+    for name, elapsed, archive_mb, growth in results:
+        print(f"{name:<32} {elapsed:>8.1f} {archive_mb:>11.1f} {growth:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""Cold and warm "/" load work before and after moving bootstrap to startup.
+
+Run from the repository root: python -m benchmarks.bootstrap
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+import bcrypt
+import reflex as rx
+import sqlmodel
+from reflex.config import get_config
+from reflex.state import State
+from sqlmodel import SQLModel
+from app.models import AgeCategory, BeltRank, Setting, User
+from app.services.db import configure_sqlite
+from app.services.schema import (
+    DEFAULT_AGE_CATEGORIES,
+    DEFAULT_BELTS,
+    DEFAULT_SETTINGS,
+    run_migrations,
+)
+from app.states.dashboard_state import DashboardState
+
+
+def initialize_database():
+    """What every "/" visit used to run before load_stats."""
+    with rx.session() as session:
+        SQLModel.metadata.create_all(session.get_bind())
+        admin = session.exec(
+            sqlmodel.select(User).where(User.username == "admin")
+        ).first()
+        if not admin:
+            hashed = bcrypt.hashpw(b"admin123", bcrypt.gensalt()).decode("utf-8")
+            session.add(
+                User(
+                    username="admin", password_hash=hashed, role="admin", is_active=True
+                )
+            )
+        if not session.exec(sqlmodel.select(BeltRank)).first():
+            for order, name in enumerate(DEFAULT_BELTS, start=1):
+                session.add(BeltRank(name=name, color=name.lower(), rank_order=order))
+        if not session.exec(sqlmodel.select(AgeCategory)).first():
+            for name, min_age, max_age, description in DEFAULT_AGE_CATEGORIES:
+                session.add(
+                    AgeCategory(
+                        name=name,
+                        min_age=min_age,
+                        max_age=max_age,
+                        description=description,
+                    )
+                )
+        for key, value, description in DEFAULT_SETTINGS:
+            if not session.exec(
+                sqlmodel.select(Setting).where(Setting.key == key)
+            ).first():
+                session.add(Setting(key=key, value=value, description=description))
+        session.commit()
+
+
+def load_stats():
+    root = State(_reflex_internal_init=True)
+    state = root.get_substate(DashboardState.get_full_name().split("."))
+    state.notifications_checked = True
+
+    async def consume():
+        async for _ in DashboardState.event_handlers["load_stats"].fn(state):
+            pass
+
+    asyncio.run(consume())
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def use_database(path: Path):
+    os.environ["REFLEX_DB_URL"] = f"sqlite:///{path}"
+    get_config(reload=True)
+    return rx.model.get_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--warm-visits", type=int, default=20)
+    args = parser.parse_args()
+    configure_sqlite()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        use_database(Path(directory) / "old.db")
+        old_cold = timed(lambda: (initialize_database(), load_stats()))
+        old_warm = min(
+            timed(lambda: (initialize_database(), load_stats()))
+            for _ in range(args.warm_visits)
+        )
+        results["old"] = (0.0, old_cold, old_warm)
+        engine = use_database(Path(directory) / "new.db")
+        startup = timed(lambda: run_migrations(engine))
+        new_cold = timed(load_stats)
+        new_warm = min(timed(load_stats) for _ in range(args.warm_visits))
+        results["new"] = (startup, new_cold, new_warm)
+    print(f"{'bootstrap':<10} {'startup ms':>11} {'cold / ms':>10} {'warm / ms':>10}")
+    for name, (startup, cold, warm) in results.items():
+        print(f"{name:<10} {startup:>11.1f} {cold:>10.1f} {warm:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Marking a whole session present: one upsert versus one transaction per athlete.
+
+Run from the repository root: python -m benchmarks.bulk_attendance
+"""
+
+import argparse
+import datetime
+import reflex as rx
+import sqlmodel
+from app.models import Attendance
+from app.services.attendance import upsert_attendance
+from benchmarks.common import insert_athletes, median_seconds, scratch_database
+
+
+def mark_one_by_one(athlete_ids: list[int], day: datetime.date, status: str):
+    """The per-click path: look up, write and commit each athlete separately."""
+    for athlete_id in athlete_ids:
+        with rx.session() as session:
+            record = session.exec(
+                sqlmodel.select(Attendance)
+                .where(Attendance.athlete_id == athlete_id)
+                .where(Attendance.day == day)
+            ).first()
+            if record:
+                record.status = status
+            else:
+                record = Attendance(
+                    athlete_id=athlete_id,
+                    date=datetime.datetime.combine(day, datetime.time()),
+                    day=day,
+                    status=status,
+                    class_time="18:00",
+                )
+            session.add(record)
+            session.commit()
+
+
+def mark_bulk(athlete_ids: list[int], day: datetime.date, status: str):
+    with rx.session() as session:
+        upsert_attendance(session, athlete_ids, day, status, "18:00")
+        session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--athletes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    athlete_ids = list(range(1, args.athletes + 1))
+    print(f"{args.athletes} athletes per session")
+    print(f"{'path':<14} {'insert ms':>10} {'update ms':>10}")
+    with scratch_database() as engine:
+        insert_athletes(engine, args.athletes)
+        for name, mark in (
+            ("per athlete", mark_one_by_one),
+            ("bulk upsert", mark_bulk),
+        ):
+            days = iter(
+                datetime.date(2020, 1, 1) + datetime.timedelta(days=offset)
+                for offset in range(10_000)
+            )
+            fresh_days = []
+
+            def insert():
+                fresh_days.append(next(days))
+                mark(athlete_ids, fresh_days[-1], "Present")
+
+            inserted = median_seconds(insert, args.repeat)
+            updated = median_seconds(
+                lambda: mark(athlete_ids, fresh_days[0], "Late"), args.repeat
+            )
+            print(f"{name:<14} {inserted * 1000:>10.1f} {updated * 1000:>10.1f}")
+            with engine.begin() as connection:
+                assert connection.exec_driver_sql(
+                    "SELECT COUNT(*) FROM attendance WHERE day = ?",
+                    (fresh_days[0].isoformat(),),
+                ).scalar() == len(athlete_ids)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+import contextlib
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+import reflex as rx
+import sqlalchemy
+from reflex.config import get_config
+from app.services.db import configure_sqlite
+from app.services.schema import run_migrations
+
+
+@contextlib.contextmanager
+def scratch_database() -> Iterator[sqlalchemy.engine.Engine]:
+    """Point rx.session() at a freshly migrated database in a temporary directory."""
+    previous = os.environ.get("REFLEX_DB_URL")
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["REFLEX_DB_URL"] = f"sqlite:///{Path(directory) / 'reflex.db'}"
+        get_config(reload=True)
+        configure_sqlite()
+        engine = rx.model.get_engine()
+        run_migrations(engine)
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+            if previous is None:
+                os.environ.pop("REFLEX_DB_URL", None)
+            else:
+                os.environ["REFLEX_DB_URL"] = previous
+            get_config(reload=True)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def median_seconds(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Run fn repeat times and return the median wall-clock duration."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def insert_athletes(engine, count: int, start: int = 0):
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO athlete (full_name, date_of_birth, gender, joined_date,"
+            " is_active, phone) VALUES (?, '2012-01-01', 'Male', '2024-01-01', 1, ?)",
+            [
+                (f"Athlete {number}", f"0555{number:06d}")
+                for number in range(start, start + count)
+            ],
+        )
\ No newline at end of file
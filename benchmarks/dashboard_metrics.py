@@ -0,0 +1,92 @@
+"""Dashboard load time as the payment table grows.
+
+Run from the repository root: python -m benchmarks.dashboard_metrics
+"""
+
+import argparse
+import datetime
+import reflex as rx
+import sqlmodel
+from app.models import Athlete, Coach, Payment
+from app.services.dashboard_metrics import load_dashboard_metrics
+from benchmarks.common import insert_athletes, median_seconds, scratch_database
+
+
+def materialised_metrics(session, month: int, year: int):
+    """The row-by-row version load_stats used before the aggregate query."""
+    athletes = session.exec(
+        sqlmodel.select(Athlete).where(Athlete.is_active == True)
+    ).all()
+    coaches = session.exec(sqlmodel.select(Coach).where(Coach.is_active == True)).all()
+    payments = session.exec(
+        sqlmodel.select(Payment).where(
+            (Payment.month_covered == month) & (Payment.year_covered == year)
+        )
+    ).all()
+    paid = {payment.athlete_id for payment in payments}
+    return (
+        len(athletes),
+        len(coaches),
+        sum(payment.amount for payment in payments),
+        len(athletes) - len(paid),
+    )
+
+
+def add_payments(engine, athletes: int, first: int, last: int):
+    """Add payments first..last-1, one per athlete per month, newest month first."""
+    today = datetime.date.today()
+    rows = []
+    for number in range(first, last):
+        month_index = today.year * 12 + today.month - 1 - number // athletes
+        year, month = divmod(month_index, 12)
+        rows.append(
+            (
+                number % athletes + 1,
+                500.0,
+                f"{year}-{month + 1:02d}-05 10:00:00",
+                month + 1,
+                year,
+            )
+        )
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO payment (athlete_id, amount, payment_type, payment_date,"
+            " month_covered, year_covered, status)"
+            " VALUES (?, ?, 'Monthly', ?, ?, ?, 'Paid')",
+            rows,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--athletes", type=int, default=2000)
+    parser.add_argument(
+        "--payments", type=int, nargs="+", default=[2000, 10000, 50000, 100000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    today = datetime.date.today()
+    print(f"{args.athletes} active athletes, one payment per athlete per month")
+    print(f"{'payments':>9} {'aggregate ms':>13} {'row-by-row ms':>14}")
+    with scratch_database() as engine:
+        insert_athletes(engine, args.athletes)
+        total = 0
+        for payments in sorted(args.payments):
+            add_payments(engine, args.athletes, total, payments)
+            total = payments
+            with rx.session() as session:
+                aggregate = median_seconds(
+                    lambda: load_dashboard_metrics(session, today.month, today.year),
+                    args.repeat,
+                )
+                materialised = median_seconds(
+                    lambda: materialised_metrics(session, today.month, today.year),
+                    args.repeat,
+                )
+            print(
+                f"{payments:>9} {aggregate * 1000:>13.2f} {materialised * 1000:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Size of the hydrate delta, the full root State sent to every client on load.
+
+Measures a git revision and the working tree side by side. Each tree is
+imported in its own interpreter, so both see their own state classes. The
+default revision is the one before translations moved out of LanguageState
+into static per-language bundles.
+
+Run from the repository root: python -m benchmarks.hydrate_payload [--before REV]
+"""
+
+import argparse
+import asyncio
+import importlib
+import io
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+from reflex.state import State, _resolve_delta
+from reflex.utils import format
+import app.states
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+DEFAULT_BEFORE = "2f58150~1"
+LANGUAGE_STATE = "language_state"
+
+
+def hydrate_sizes() -> dict[str, int]:
+    """Serialized bytes per substate of the hydrate delta, as the middleware builds it."""
+    for module in pkgutil.iter_modules(app.states.__path__):
+        importlib.import_module(f"app.states.{module.name}")
+    root = State(_reflex_internal_init=True)
+    delta = asyncio.run(_resolve_delta(root.dict()))
+    sizes = {name: len(format.json_dumps(values)) for name, values in delta.items()}
+    sizes["total"] = len(format.json_dumps(delta))
+    return sizes
+
+
+def measure(tree: Path) -> dict[str, int]:
+    with tempfile.NamedTemporaryFile(suffix=".json") as output:
+        subprocess.run(
+            [sys.executable, __file__, "--output", output.name],
+            cwd=tree,
+            env={**os.environ, "PYTHONPATH": str(tree)},
+            check=True,
+            capture_output=True,
+        )
+        return json.loads(Path(output.name).read_text())
+
+
+def measure_revision(revision: str) -> dict[str, int]:
+    archive = subprocess.run(
+        ["git", "archive", revision],
+        cwd=REPOSITORY,
+        check=True,
+        capture_output=True,
+    ).stdout
+    with tempfile.TemporaryDirectory() as directory:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(directory, filter="data")
+        return measure(Path(directory))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--before", default=DEFAULT_BEFORE)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.output:
+        Path(args.output).write_text(json.dumps(hydrate_sizes()))
+        return
+    before = measure_revision(args.before)
+    after = measure(REPOSITORY)
+    language = {
+        label: next((size for name, size in sizes.items() if LANGUAGE_STATE in name), 0)
+        for label, sizes in (("before", before), ("after", after))
+    }
+    print(f"{'':<16} {args.before:>12} {'working tree':>13} {'change':>8}")
+    for label, old, new in (
+        ("LanguageState", language["before"], language["after"]),
+        ("hydrate delta", before["total"], after["total"]),
+    ):
+        print(f"{label:<16} {old:>12} {new:>13} {new - old:>+8}")
+
+
+if __name__ == "__main__":
+    main()
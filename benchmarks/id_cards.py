@@ -0,0 +1,70 @@
+"""Batch ID-card throughput: serial encoding versus the pooled, cached pipeline.
+
+Run from the repository root: python -m benchmarks.id_cards
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from app.services.id_cards import IdCard, render_id_card_sheet
+from app.services.qr_cache import (
+    ensure_qr_codes,
+    qr_cache_dir,
+    qr_payload,
+    write_qr_png,
+)
+from app.services.workers import MAX_WORKERS, run_in_pool
+
+
+def serial(cards: list[IdCard], directory: Path) -> float:
+    """Encode every QR code in-process, as the event handler used to."""
+    started = time.perf_counter()
+    paths = []
+    for card in cards:
+        path = directory / f"serial_{card.athlete_id}.png"
+        write_qr_png(qr_payload(card.athlete_id, card.full_name), str(path))
+        paths.append(path)
+    render_id_card_sheet(str(directory / "serial.pdf"), cards, paths)
+    return time.perf_counter() - started
+
+
+async def pooled_pipeline(cards: list[IdCard], directory: Path):
+    """Encode through the QR cache and lay the sheet out in a pool worker."""
+    paths = await ensure_qr_codes(
+        [qr_payload(card.athlete_id, card.full_name) for card in cards]
+    )
+    await run_in_pool(render_id_card_sheet, str(directory / "pooled.pdf"), cards, paths)
+
+
+def pooled(cards: list[IdCard], directory: Path) -> float:
+    started = time.perf_counter()
+    asyncio.run(pooled_pipeline(cards, directory))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=2000)
+    args = parser.parse_args()
+    cards = [
+        IdCard(number, f"Athlete {number}", "Green")
+        for number in range(1, args.cards + 1)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["REFLEX_UPLOADED_FILES_DIR"] = directory
+        directory = Path(directory)
+        results = [("serial", serial(cards, directory))]
+        results.append((f"pooled x{MAX_WORKERS}, cold cache", pooled(cards, directory)))
+        results.append((f"pooled x{MAX_WORKERS}, warm cache", pooled(cards, directory)))
+        assert len(list(qr_cache_dir().glob("*.png"))) == len(cards)
+    print(f"{args.cards} cards")
+    print(f"{'pipeline':<26} {'seconds':>8} {'cards/s':>8}")
+    for name, seconds in results:
+        print(f"{name:<26} {seconds:>8.2f} {len(cards) / seconds:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
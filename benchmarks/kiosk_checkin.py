@@ -0,0 +1,79 @@
+"""Load test for the kiosk check-in route at a steady scan rate.
+
+Scans go through httpx's ASGI transport straight into the API app and are
+fired open-loop, so slow responses cannot slow the arrival rate down.
+
+Run from the repository root: python -m benchmarks.kiosk_checkin
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import httpx
+from app.api import api
+from benchmarks.common import insert_athletes, scratch_database
+
+KIOSK_TOKEN = "benchmark"
+
+
+async def load(app, rate: float, seconds: float, athletes: int):
+    latencies = []
+    failures = 0
+
+    async def scan(client: httpx.AsyncClient, athlete_id: int):
+        nonlocal failures
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/checkin",
+            json={"payload": f"GALIA:{athlete_id}:Athlete {athlete_id}"},
+            headers={"X-Kiosk-Token": KIOSK_TOKEN},
+        )
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            failures += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://kiosk"
+    ) as client:
+        tasks = []
+        started = time.perf_counter()
+        for number in range(int(rate * seconds)):
+            await asyncio.sleep(max(0.0, started + number / rate - time.perf_counter()))
+            tasks.append(asyncio.create_task(scan(client, number % athletes + 1)))
+        await asyncio.gather(*tasks)
+    return latencies, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=10.0, help="scans per second")
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--athletes", type=int, default=300)
+    args = parser.parse_args()
+    os.environ["GALIA_KIOSK_TOKEN"] = KIOSK_TOKEN
+    with scratch_database() as engine:
+        insert_athletes(engine, args.athletes)
+        latencies, failures = asyncio.run(
+            load(api, args.rate, args.seconds, args.athletes)
+        )
+        with engine.begin() as connection:
+            recorded = connection.exec_driver_sql(
+                "SELECT COUNT(*) FROM attendance"
+            ).scalar()
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    print(
+        f"{len(latencies)} scans at {args.rate:g}/s, {failures} failed,"
+        f" {recorded} attendance rows"
+    )
+    print(
+        f"median {statistics.median(latencies_ms):.1f} ms,"
+        f" p95 {latencies_ms[int(len(latencies_ms) * 0.95) - 1]:.1f} ms,"
+        f" max {latencies_ms[-1]:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
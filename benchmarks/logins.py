@@ -0,0 +1,84 @@
+"""Login throughput under concurrency, and how long logins stall the event loop.
+
+Run from the repository root: python -m benchmarks.logins
+"""
+
+import argparse
+import asyncio
+import time
+import bcrypt
+from app.services.passwords import bcrypt_rounds
+from app.states.auth_state import _authenticate
+from benchmarks.common import scratch_database
+
+TICK_SECONDS = 0.01
+
+
+def inline_login(password: str) -> bool:
+    """The old login path: hash a fresh password and check it on the event loop."""
+    reference = bcrypt.hashpw(b"admin123", bcrypt.gensalt())
+    return bcrypt.checkpw(password.encode("utf-8"), reference)
+
+
+async def measure(login, concurrency: int, logins: int) -> tuple[float, float]:
+    """Return logins per second and the worst event-loop stall in milliseconds."""
+    stall = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal stall
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            stall = max(stall, time.perf_counter() - started - TICK_SECONDS)
+
+    queue = asyncio.Queue()
+    for _ in range(logins):
+        queue.put_nowait(None)
+
+    async def client():
+        while not queue.empty():
+            queue.get_nowait()
+            assert await login()
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    running = False
+    await tick
+    return logins / elapsed, stall * 1000
+
+
+async def run(concurrency: int, logins: int):
+    async def threaded():
+        return await asyncio.to_thread(_authenticate, "admin", "admin123")
+
+    async def inline():
+        return inline_login("admin123")
+
+    return {
+        "inline (old)": await measure(inline, concurrency, logins),
+        "worker thread": await measure(threaded, concurrency, logins),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=32)
+    args = parser.parse_args()
+    with scratch_database():
+        results = asyncio.run(run(args.concurrency, args.logins))
+    print(
+        f"{args.logins} logins, {args.concurrency} concurrent clients,"
+        f" bcrypt cost {bcrypt_rounds()}"
+    )
+    print(f"{'path':<14} {'logins/s':>9} {'worst loop stall ms':>20}")
+    for name, (rate, stall) in results.items():
+        print(f"{name:<14} {rate:>9.1f} {stall:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Streaming CSV export of a large attendance report under a memory ceiling.
+
+The export runs twice: once without tracing, for throughput and RSS, then
+under tracemalloc. The ceiling applies to the traced Python heap peak.
+Peak RSS is reported too; its growth also includes SQLite's page cache and
+memory-mapped database pages, which the cache_size and mmap_size PRAGMAs cap.
+
+Run from the repository root: python -m benchmarks.report_export
+"""
+
+import argparse
+import datetime
+import sys
+import time
+import tracemalloc
+from app.services.report_export import iter_report_csv
+from benchmarks.common import peak_rss_mb, scratch_database
+
+DAY_ZERO = datetime.date(2020, 1, 1)
+
+
+def seed(engine, rows: int, athletes: int):
+    with engine.begin() as connection:
+        for start in range(0, rows, 100_000):
+            batch = []
+            for number in range(start, min(rows, start + 100_000)):
+                day = DAY_ZERO + datetime.timedelta(days=number // athletes)
+                batch.append(
+                    (number % athletes + 1, f"{day} 18:00:00", day.isoformat())
+                )
+            connection.exec_driver_sql(
+                "INSERT INTO attendance (athlete_id, date, day, status, class_time)"
+                " VALUES (?, ?, ?, 'Present', '18:00')",
+                batch,
+            )
+
+
+def export(start: datetime.datetime, end: datetime.datetime) -> tuple[int, int]:
+    """Drain the attendance export; return its line count and byte size."""
+    lines = size = 0
+    for chunk in iter_report_csv("Attendance", start, end):
+        size += len(chunk.encode("utf-8"))
+        lines += chunk.count("\n")
+    return lines, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--athletes", type=int, default=2000)
+    parser.add_argument(
+        "--ceiling-mb",
+        type=float,
+        default=16.0,
+        help="fail if the export's traced Python heap peaks above this",
+    )
+    args = parser.parse_args()
+    with scratch_database() as engine:
+        seed(engine, args.rows, args.athletes)
+        start = datetime.datetime.combine(DAY_ZERO, datetime.time())
+        end = start + datetime.timedelta(days=args.rows // args.athletes + 1)
+        baseline = peak_rss_mb()
+        started = time.perf_counter()
+        lines, size = export(start, end)
+        elapsed = time.perf_counter() - started
+        growth = peak_rss_mb() - baseline
+        tracemalloc.start()
+        export(start, end)
+        heap_peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    print(
+        f"exported {lines - 1} rows, {size / 1e6:.1f} MB of CSV in {elapsed:.1f}s"
+        f" ({(lines - 1) / elapsed:,.0f} rows/s)"
+    )
+    print(
+        f"Python heap peak {heap_peak:.1f} MB (ceiling {args.ceiling_mb:g} MB),"
+        f" peak RSS growth {growth:.1f} MB"
+    )
+    if lines - 1 != args.rows or heap_peak > args.ceiling_mb:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
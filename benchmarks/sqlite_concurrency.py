@@ -0,0 +1,119 @@
+"""Concurrent read/write throughput with SQLite's defaults and with the tuned PRAGMAs.
+
+Run from the repository root: python -m benchmarks.sqlite_concurrency
+"""
+
+import argparse
+import datetime
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+import sqlmodel
+from app.services.db import sqlite_pragmas
+from app.services.schema import run_migrations
+
+READ_QUERY = """
+SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM payment
+WHERE year_covered = ? AND month_covered = ?
+"""
+WRITE_QUERY = """
+INSERT INTO attendance (athlete_id, date, day, status, class_time)
+VALUES (?, ?, ?, 'Present', '18:00')
+"""
+
+
+def prepare(path: Path, payments: int):
+    engine = sqlmodel.create_engine(f"sqlite:///{path}")
+    run_migrations(engine)
+    engine.dispose()
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.executemany(
+            "INSERT INTO payment (athlete_id, amount, payment_type, payment_date,"
+            " month_covered, year_covered, status)"
+            " VALUES (?, 500, 'Monthly', '2024-05-05', 5, 2024, 'Paid')",
+            [(number,) for number in range(payments)],
+        )
+    connection.close()
+
+
+def connect(path: Path, tuned: bool) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+    if tuned:
+        for name, value in sqlite_pragmas(connection).items():
+            connection.execute(f"PRAGMA {name} = {value}")
+    else:
+        connection.execute("PRAGMA journal_mode = DELETE")
+    return connection
+
+
+def run(path: Path, tuned: bool, readers: int, writers: int, seconds: float):
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def reader():
+        connection = connect(path, tuned)
+        done = 0
+        while not stop.is_set():
+            connection.execute(READ_QUERY, (2024, 5)).fetchone()
+            done += 1
+        connection.close()
+        with lock:
+            counts["reads"] += done
+
+    def writer(number: int):
+        connection = connect(path, tuned)
+        done = errors = 0
+        day = datetime.date(2000, 1, 1)
+        while not stop.is_set():
+            try:
+                with connection:
+                    connection.execute(
+                        WRITE_QUERY,
+                        (number, day.isoformat() + " 18:00:00", day.isoformat()),
+                    )
+                done += 1
+            except sqlite3.OperationalError:
+                errors += 1
+            day += datetime.timedelta(days=1)
+        connection.close()
+        with lock:
+            counts["writes"] += done
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--payments", type=int, default=20000)
+    args = parser.parse_args()
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s per run")
+    print(f"{'mode':>9} {'reads/s':>9} {'writes/s':>9} {'locked/s':>9}")
+    for tuned in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "reflex.db"
+            prepare(path, args.payments)
+            result = run(path, tuned, args.readers, args.writers, args.seconds)
+        print(
+            f"{'tuned' if tuned else 'default':>9} {result['reads']:>9.0f}"
+            f" {result['writes']:>9.0f} {result['errors']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
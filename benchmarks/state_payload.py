@@ -0,0 +1,99 @@
+"""State delta size per PaymentState event, as sent over the websocket.
+
+Run from the repository root: python -m benchmarks.state_payload
+"""
+
+import argparse
+import asyncio
+import inspect
+import random
+from reflex.state import State
+from reflex.utils import format
+from sqlmodel import Session, select
+from app.models import Athlete, Payment
+from app.states.payment_state import PaymentState, _payment_data
+from benchmarks.common import insert_athletes, scratch_database
+
+
+def seed(engine, athletes: int, payments: int):
+    insert_athletes(engine, athletes)
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO payment (athlete_id, amount, payment_type, payment_date,"
+            " month_covered, year_covered, status, notes)"
+            " VALUES (?, 500, 'Monthly Fee', ?, ?, 2024, ?, '')",
+            [
+                (
+                    random.randint(1, athletes),
+                    f"2024-{number % 12 + 1:02d}-{number % 28 + 1:02d} 10:00:00",
+                    number % 12 + 1,
+                    random.choice(["Paid", "Pending"]),
+                )
+                for number in range(payments)
+            ],
+        )
+
+
+def delta_bytes(root: State) -> int:
+    size = len(format.json_dumps(root.get_delta()))
+    root._clean()
+    return size
+
+
+def run_event(root: State, state: PaymentState, name: str, *args) -> int:
+    result = PaymentState.event_handlers[name].fn(state, *args)
+    if inspect.isawaitable(result):
+        asyncio.run(result)
+    return delta_bytes(root)
+
+
+def full_list_bytes(engine) -> int:
+    """Size of shipping every payment row, as the old filtered_payments list did."""
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Payment, Athlete.full_name).join(
+                Athlete, Athlete.id == Payment.athlete_id
+            )
+        ).all()
+    return len(format.json_dumps([_payment_data(p, name) for p, name in rows]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--athletes", type=int, default=500)
+    parser.add_argument("--payments", type=int, default=5000)
+    args = parser.parse_args()
+    random.seed(0)
+    with scratch_database() as engine:
+        seed(engine, args.athletes, args.payments)
+        root = State(_reflex_internal_init=True)
+        state = root.get_substate(PaymentState.get_full_name().split("."))
+        delta_bytes(root)
+        results = [("load_data", run_event(root, state, "load_data"))]
+        results.append(("next_page", run_event(root, state, "next_page")))
+        results.append(("prev_page", run_event(root, state, "prev_page")))
+        results.append(("set_search", run_event(root, state, "set_search", "Athl")))
+        results.append(("set_search ''", run_event(root, state, "set_search", "")))
+        payment = state.payments[0]
+        results.append(
+            ("open_edit_modal", run_event(root, state, "open_edit_modal", payment))
+        )
+        state.form_notes = "edited"
+        delta_bytes(root)
+        results.append(("save_payment (edit)", run_event(root, state, "save_payment")))
+        results.append(
+            (
+                "delete_payment",
+                run_event(root, state, "delete_payment", state.payments[1].id),
+            )
+        )
+        reference = full_list_bytes(engine)
+    print(f"{args.payments} payments, {args.athletes} athletes")
+    print(f"{'event':<22} {'delta bytes':>12}")
+    for name, size in results:
+        print(f"{name:<22} {size:>12}")
+    print(f"{'(full payment list)':<22} {reference:>12}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
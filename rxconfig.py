@@ -1,3 +1,20 @@
+import os
 import reflex as rx
 
-config = rx.Config(app_name="app", plugins=[rx.plugins.TailwindV3Plugin()])
+config = rx.Config(
+    app_name="app",
+    plugins=[rx.plugins.TailwindV3Plugin()],
+    bcrypt_rounds=12,
+    kiosk_token=os.environ.get("GALIA_KIOSK_TOKEN"),
+    backup_interval_minutes=60,
+    full_backup_interval_hours=24,
+    backup_retention={"hourly": 24, "daily": 7, "weekly": 4},
+    sqlite_pragmas={
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import pytest
+import reflex as rx
+from reflex.config import get_config
+from app.services import backups
+from app.services.db import configure_sqlite
+from app.services.schema import run_migrations
+from app.services.settings import settings_cache
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setenv("REFLEX_DB_URL", f"sqlite:///{tmp_path / 'reflex.db'}")
+    monkeypatch.setattr(backups, "BACKUP_DIR", tmp_path / "backups")
+    get_config(reload=True)
+    configure_sqlite()
+    engine = rx.model.get_engine()
+    run_migrations(engine)
+    settings_cache.invalidate()
+    yield engine
+    engine.dispose()
+    settings_cache.invalidate()
+    monkeypatch.undo()
+    get_config(reload=True)
+
+
+def add_athlete(engine, name: str):
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO athlete (full_name, date_of_birth, gender, joined_date,"
+            " is_active) VALUES (?, '2012-01-01', 'Male', '2024-01-01', 1)",
+            (name,),
+        )
+
+
+def athlete_names(engine) -> list[str]:
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql("SELECT full_name FROM athlete ORDER BY id")
+        return [name for (name,) in rows]
+
+
+def test_restore_keeps_backup_history(engine):
+    add_athlete(engine, "Before")
+    full = backups.create_backup()
+    add_athlete(engine, "After")
+    incremental = backups.create_backup(incremental=True)
+    assert incremental.name.endswith(".incr.zip")
+
+    backups.restore_backup(full)
+    settings_cache.invalidate()
+
+    assert athlete_names(engine) == ["Before"]
+    history = backups.load_backup_history()
+    assert [entry["name"] for entry in history] == [full.name, incremental.name]
+    assert full.is_file() and incremental.is_file()
+
+    backups.restore_backup(incremental)
+    settings_cache.invalidate()
+    assert athlete_names(engine) == ["Before", "After"]
+    assert len(backups.load_backup_history()) == 2
@@ -0,0 +1,72 @@
+import datetime
+import re
+import pytest
+import sqlmodel
+from sqlmodel import func
+from app.models import (
+    Athlete,
+    Attendance,
+    BeltPromotion,
+    CompetitionResult,
+    Payment,
+    Setting,
+)
+from app.services.report_export import report_query
+from app.services.schema import run_migrations
+
+TABLE_SCAN = re.compile(r"SCAN (TABLE )?(\w+)")
+START = datetime.datetime(2024, 1, 1)
+END = datetime.datetime(2024, 2, 1)
+
+HOT_QUERIES = {
+    "attendance by athlete and day": sqlmodel.select(Attendance.id).where(
+        (Attendance.athlete_id == 1) & (Attendance.day == START.date())
+    ),
+    "attendance report by date": report_query("Attendance", START, END)[1],
+    "payments by covered month": sqlmodel.select(func.sum(Payment.amount)).where(
+        (Payment.month_covered == 1) & (Payment.year_covered == 2024)
+    ),
+    "payments report by date": report_query("Payments", START, END)[1],
+    "payments by athlete": sqlmodel.select(Payment.id).where(Payment.athlete_id == 1),
+    "competition result lookup": sqlmodel.select(CompetitionResult.id).where(
+        (CompetitionResult.competition_id == 1)
+        & (CompetitionResult.athlete_id == 1)
+        & (CompetitionResult.category == "Kata")
+    ),
+    "active athletes by name": sqlmodel.select(Athlete.id, Athlete.full_name)
+    .where(Athlete.is_active == True)
+    .order_by(Athlete.full_name),
+    "athlete by fingerprint": sqlmodel.select(Athlete.id).where(
+        Athlete.fingerprint == "abc"
+    ),
+    "belt history": sqlmodel.select(BeltPromotion.id)
+    .where(BeltPromotion.athlete_id == 1)
+    .order_by(BeltPromotion.promotion_date.desc()),
+    "setting by key": sqlmodel.select(Setting.value).where(
+        Setting.key == "monthly_fee"
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    path = tmp_path_factory.mktemp("plans") / "reflex.db"
+    engine = sqlmodel.create_engine(f"sqlite:///{path}")
+    run_migrations(engine)
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement) -> list[str]:
+    compiled = statement.compile(dialect=engine.dialect)
+    params = (None,) * len(compiled.positiontup or ())
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+        return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_an_index(engine, name):
+    plan = query_plan(engine, HOT_QUERIES[name])
+    scans = [detail for detail in plan if TABLE_SCAN.fullmatch(detail)]
+    assert not scans, f"{name} falls back to a table scan: {plan}"
\ No newline at end of file